@@ -30,8 +30,13 @@
 
 """
 
+import copy
+import hashlib
 import os
 import json
+import stat
+import tempfile
+import threading
 
 from unmanic import metadata
 from unmanic.libs import unlogger
@@ -43,21 +48,38 @@ try:
 except ImportError:
     JSONDecodeError = ValueError
 
+# Parsed settings files keyed by path. Each entry is (st_mtime_ns, st_size, data)
+_SETTINGS_CACHE = {}
+_settings_cache_lock = threading.Lock()
+
+# Serializes writes to the settings file. API handlers run in executor threads, so settings may be saved concurrently
+_settings_write_lock = threading.Lock()
+
 
 class Config(object, metaclass=SingletonType):
     app_version = ''
 
     test = ''
 
+    # The set of valid configuration fields. Populated once all defaults are assigned in __init__
+    _valid_keys = frozenset()
+
+    # Settings with a get function that does more than return the attribute value
+    _computed_keys = frozenset(['remote_installations'])
+
+    # The path, hash, mtime and size of the settings file last written
+    _last_settings_write = None
+
     def __init__(self, config_path=None, **kwargs):
         # Set the default UI Port
         self.ui_port = 8888
 
         # Set default directories
-        self.config_path = os.path.join(common.get_home_dir(), '.unmanic', 'config')
-        self.log_path = os.path.join(common.get_home_dir(), '.unmanic', 'logs')
-        self.plugins_path = os.path.join(common.get_home_dir(), '.unmanic', 'plugins')
-        self.userdata_path = os.path.join(common.get_home_dir(), '.unmanic', 'userdata')
+        unmanic_home_path = os.path.join(common.get_home_dir(), '.unmanic')
+        self.config_path = os.path.join(unmanic_home_path, 'config')
+        self.log_path = os.path.join(unmanic_home_path, 'logs')
+        self.plugins_path = os.path.join(unmanic_home_path, 'plugins')
+        self.userdata_path = os.path.join(unmanic_home_path, 'userdata')
 
         # Configure debugging
         self.debugging = False
@@ -93,6 +115,9 @@ class Config(object, metaclass=SingletonType):
         self.number_of_workers = None
         self.worker_event_schedules = None
 
+        # Snapshot the valid config keys. This is stored on the class so that it is not dumped with the settings
+        type(self)._valid_keys = frozenset(self.__dict__)
+
         # Import env variables and override all previous settings.
         self.__import_settings_from_env()
 
@@ -165,9 +190,10 @@ class Config(object, metaclass=SingletonType):
 
         :return:
         """
-        for setting in self.get_config_keys():
-            if setting in os.environ:
-                self.set_config_item(setting, os.environ.get(setting), save_settings=False)
+        environ = dict(os.environ)
+        # Only walk the config keys that are actually set in the environment
+        for setting in environ.keys() & self._valid_keys:
+            self.set_config_item(setting, environ[setting], save_settings=False)
 
     def __import_settings_from_file(self, config_path=None):
         """
@@ -185,28 +211,77 @@ class Config(object, metaclass=SingletonType):
         if os.path.exists(settings_file):
             data = {}
             try:
-                with open(settings_file) as infile:
-                    data = json.load(infile)
+                data = self.__read_settings_file(settings_file)
             except Exception as e:
                 self._log("Exception in reading saved settings from file:", message2=str(e), level="exception")
             # Set data to Config class
             self.set_bulk_config_items(data, save_settings=False)
 
+    @staticmethod
+    def __read_settings_file(settings_file):
+        """
+        Return the parsed contents of a settings JSON file.
+        The parsed data is cached against the file's mtime and size so that
+        re-reading an unchanged file skips the read and JSON decode.
+
+        :param settings_file:
+        :return:
+        """
+        st = os.stat(settings_file)
+        with _settings_cache_lock:
+            cached = _SETTINGS_CACHE.get(settings_file)
+            if cached is None or cached[0] != st.st_mtime_ns or cached[1] != st.st_size:
+                with open(settings_file) as infile:
+                    data = json.load(infile)
+                cached = (st.st_mtime_ns, st.st_size, data)
+                _SETTINGS_CACHE[settings_file] = cached
+            # Return a copy. Config values such as lists are assigned directly to the class
+            return copy.deepcopy(cached[2])
+
     def __write_settings_to_file(self):
         """
         Dump current settings to the settings JSON file.
 
         :return:
         """
-        if not os.path.exists(self.get_config_path()):
-            os.makedirs(self.get_config_path())
-        settings_file = os.path.join(self.get_config_path(), 'settings.json')
-        data = self.get_config_as_dict()
-        result = common.json_dump_to_file(data, settings_file)
-        if not result['success']:
-            for message in result['errors']:
-                self._log("Error:", message2=str(message), level="error")
-            raise Exception("Exception in writing settings to file")
+        with _settings_write_lock:
+            if not os.path.exists(self.get_config_path()):
+                os.makedirs(self.get_config_path())
+            settings_file = os.path.join(self.get_config_path(), 'settings.json')
+            data = self.get_config_as_dict()
+            # Serialize first. This ensures that we never write out a partial or invalid JSON file
+            serialized = json.dumps(data, sort_keys=True, indent=4).encode('utf-8')
+            settings_hash = hashlib.blake2b(serialized, digest_size=16).digest()
+            # Skip the write if nothing has changed since the last time the settings were saved.
+            # The file must also be untouched since then, so any edits made by hand are still overwritten.
+            try:
+                file_stat = os.stat(settings_file)
+            except OSError:
+                file_stat = None
+            if file_stat is not None and self._last_settings_write == (settings_file, settings_hash,
+                                                                       file_stat.st_mtime_ns, file_stat.st_size):
+                return
+            # Write to a unique temp file in the same directory and move it into place so the settings file is
+            # replaced atomically. Keep the permissions of the existing settings file
+            file_mode = stat.S_IMODE(file_stat.st_mode) if file_stat is not None else 0o644
+            fd, tmp_settings_file = tempfile.mkstemp(prefix='.settings.', suffix='.tmp', dir=self.get_config_path())
+            try:
+                with os.fdopen(fd, 'wb') as outfile:
+                    outfile.write(serialized)
+                    outfile.flush()
+                    os.fsync(outfile.fileno())
+                os.chmod(tmp_settings_file, file_mode)
+                os.replace(tmp_settings_file, settings_file)
+                file_stat = os.stat(settings_file)
+            except Exception as e:
+                self._log("Error:", message2=str(e), level="error")
+                # Do not leave a partially written temp file behind
+                try:
+                    os.remove(tmp_settings_file)
+                except OSError:
+                    pass
+                raise Exception("Exception in writing settings to file")
+            type(self)._last_settings_write = (settings_file, settings_hash, file_stat.st_mtime_ns, file_stat.st_size)
 
     def get_config_item(self, key):
         """
@@ -215,11 +290,14 @@ class Config(object, metaclass=SingletonType):
         :param key:
         :return:
         """
-        # First attempt to fetch it from this class' get functions
-        if hasattr(self, "get_{}".format(key)):
-            getter = getattr(self, "get_{}".format(key))
-            if callable(getter):
-                return getter()
+        field_id = key.lower()
+        # Check if key is a valid setting
+        if field_id not in self._valid_keys:
+            return None
+        # Settings that require more than a plain read are fetched from this class' get functions
+        if field_id in self._computed_keys:
+            return getattr(self, "get_{}".format(field_id))()
+        return self.__dict__.get(field_id)
 
     def set_config_item(self, key, value, save_settings=True):
         """
@@ -237,7 +315,7 @@ class Config(object, metaclass=SingletonType):
         # Get lowercase value of key
         field_id = key.lower()
         # Check if key is a valid setting
-        if field_id not in self.get_config_keys():
+        if field_id not in self._valid_keys:
             self._log("Attempting to save unknown key", message2=str(key), level="warning")
             # Do not proceed if this is any key other than the database
             return
@@ -262,16 +340,24 @@ class Config(object, metaclass=SingletonType):
         """
         Write bulk config items to this class.
 
+        If 'save_settings' is set to True, then settings are saved
+        to file once after all items have been assigned.
+
         :param items:
         :param save_settings:
         :return:
         """
-        # Set values that match the settings model attributes
-        config_keys = self.get_config_keys()
-        for config_key in config_keys:
-            # Only import the item if it exists (Running a get here would default a missing var to None)
-            if config_key in items:
-                self.set_config_item(config_key, items[config_key], save_settings=save_settings)
+        # Set values that match the settings model attributes.
+        # Only import items that exist (Running a get here would default a missing var to None)
+        for config_key in items.keys() & self._valid_keys:
+            self.set_config_item(config_key, items[config_key], save_settings=False)
+
+        # Save settings (if requested)
+        if save_settings:
+            try:
+                self.__write_settings_to_file()
+            except Exception as e:
+                self._log("Failed to write settings to file: ", message2=str(self.get_config_as_dict()), level="exception")
 
     @staticmethod
     def read_version():
@@ -31,6 +31,7 @@
 """
 import copy
 import datetime
+import functools
 import hashlib
 import os
 import random
@@ -38,7 +39,14 @@ import string
 import shutil
 
 
+@functools.lru_cache(maxsize=1)
 def get_home_dir():
+    """
+    Return the home directory for this process.
+    The result is cached as HOME_DIR is expected to be set before Unmanic starts.
+
+    :return:
+    """
     home_dir = os.environ.get('HOME_DIR')
     if home_dir is None:
         home_dir = os.path.expanduser("~")
@@ -32,8 +32,12 @@
 
 import os
 import json
+import operator
+from functools import reduce
 from operator import attrgetter
 
+from peewee import Case, fn
+
 from unmanic import config
 from unmanic.libs import common, unlogger
 from unmanic.libs.unmodels import CompletedTasks, CompletedTasksCommandLogs
@@ -87,25 +91,68 @@ class History(object):
         query = CompletedTasks.select().order_by(CompletedTasks.id.desc())
         return query.count()
 
+    @staticmethod
+    def _historic_task_filters(search_value=None, id_list=None, task_success=None, after_time=None, before_time=None):
+        """
+        Build the list of conditions used to filter historic tasks
+
+        :param search_value:
+        :param id_list:
+        :param task_success:
+        :param after_time:
+        :param before_time:
+        :return:
+        """
+        filters = []
+        if id_list:
+            filters.append(CompletedTasks.id.in_(id_list))
+        if search_value:
+            filters.append(CompletedTasks.task_label.contains(search_value))
+        if task_success is not None:
+            filters.append(CompletedTasks.task_success.in_([task_success]))
+        if after_time is not None:
+            filters.append(CompletedTasks.finish_time >= after_time)
+        if before_time is not None:
+            filters.append(CompletedTasks.finish_time <= before_time)
+        return filters
+
+    def get_historic_task_status_counts(self, search_value=None, task_success=None, after_time=None, before_time=None):
+        """
+        Count the historic tasks in a single query.
+        Returns the total, successful and failed counts for all historic tasks,
+        along with the count of tasks that match the given filters.
+
+        :param search_value:
+        :param task_success:
+        :param after_time:
+        :param before_time:
+        :return: A dict of 'total_count', 'filtered_count', 'success_count' and 'failed_count'
+        """
+        filters = self._historic_task_filters(search_value=search_value, task_success=task_success,
+                                              after_time=after_time, before_time=before_time)
+        if filters:
+            filtered_count = fn.SUM(Case(None, [(reduce(operator.and_, filters), 1)], 0))
+        else:
+            filtered_count = fn.COUNT(CompletedTasks.id)
+        query = CompletedTasks.select(
+            fn.COUNT(CompletedTasks.id).alias('total_count'),
+            filtered_count.alias('filtered_count'),
+            fn.SUM(Case(None, [(CompletedTasks.task_success.in_([True]), 1)], 0)).alias('success_count'),
+            fn.SUM(Case(None, [(CompletedTasks.task_success.in_([False]), 1)], 0)).alias('failed_count'),
+        )
+        counts = query.dicts().get()
+        # SUM() returns NULL when there are no rows
+        return {key: value or 0 for key, value in counts.items()}
+
     def get_historic_task_list_filtered_and_sorted(self, order=None, start=0, length=None, search_value=None, id_list=None,
                                                    task_success=None, after_time=None, before_time=None):
         try:
             query = (CompletedTasks.select())
 
-            if id_list:
-                query = query.where(CompletedTasks.id.in_(id_list))
-
-            if search_value:
-                query = query.where(CompletedTasks.task_label.contains(search_value))
-
-            if task_success is not None:
-                query = query.where(CompletedTasks.task_success.in_([task_success]))
-
-            if after_time is not None:
-                query = query.where(CompletedTasks.finish_time >= after_time)
-
-            if before_time is not None:
-                query = query.where(CompletedTasks.finish_time <= before_time)
+            filters = self._historic_task_filters(search_value=search_value, id_list=id_list, task_success=task_success,
+                                                  after_time=after_time, before_time=before_time)
+            if filters:
+                query = query.where(*filters)
 
             # Get order by
             if order:
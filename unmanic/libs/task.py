@@ -30,11 +30,14 @@
 
 """
 import json
+import operator
 import os
 import shutil
 import time
+from functools import reduce
 from operator import attrgetter
 
+from peewee import Case, fn
 from playhouse.shortcuts import model_to_dict
 
 from unmanic import config
@@ -320,22 +323,57 @@ class Task(object):
         task_query = Tasks.select().order_by(Tasks.id.desc())
         return task_query.count()
 
+    @staticmethod
+    def _task_filters(search_value=None, id_list=None, status=None, task_type=None):
+        """
+        Build the list of conditions used to filter tasks
+
+        :param search_value:
+        :param id_list:
+        :param status:
+        :param task_type:
+        :return:
+        """
+        filters = []
+        if id_list:
+            filters.append(Tasks.id.in_(id_list))
+        if search_value:
+            filters.append(Tasks.abspath.contains(search_value))
+        if status:
+            filters.append(Tasks.status.in_([status]))
+        if task_type:
+            filters.append(Tasks.type.in_([task_type]))
+        return filters
+
+    def get_task_list_counts(self, search_value=None, status=None):
+        """
+        Count all tasks and the tasks that match the given filters in a single query
+
+        :param search_value:
+        :param status:
+        :return: A dict of 'total_count' and 'filtered_count'
+        """
+        filters = self._task_filters(search_value=search_value, status=status)
+        if filters:
+            filtered_count = fn.SUM(Case(None, [(reduce(operator.and_, filters), 1)], 0))
+        else:
+            filtered_count = fn.COUNT(Tasks.id)
+        query = Tasks.select(
+            fn.COUNT(Tasks.id).alias('total_count'),
+            filtered_count.alias('filtered_count'),
+        )
+        counts = query.dicts().get()
+        # SUM() returns NULL when there are no rows
+        return {key: value or 0 for key, value in counts.items()}
+
     def get_task_list_filtered_and_sorted(self, order=None, start=0, length=None, search_value=None, id_list=None,
                                           status=None, task_type=None):
         try:
             query = (Tasks.select())
 
-            if id_list:
-                query = query.where(Tasks.id.in_(id_list))
-
-            if search_value:
-                query = query.where(Tasks.abspath.contains(search_value))
-
-            if status:
-                query = query.where(Tasks.status.in_([status]))
-
-            if task_type:
-                query = query.where(Tasks.type.in_([task_type]))
+            filters = self._task_filters(search_value=search_value, id_list=id_list, status=status, task_type=task_type)
+            if filters:
+                query = query.where(*filters)
 
             # Get order by
             order_by = None
@@ -29,6 +29,8 @@
            OR OTHER DEALINGS IN THE SOFTWARE.
 
 """
+import functools
+import hashlib
 import json
 import re
 import sys
@@ -46,6 +48,62 @@ from tornado.ioloop import IOLoop
 
 from tornado.web import RequestHandler
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data):
+    """
+    Decode JSON data. Uses orjson if it is installed.
+    Invalid data is decoded again with the stdlib json module so the error raised
+    has the same message whether or not orjson is installed.
+
+    :param data:
+    :return:
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def json_dumps(data):
+    """
+    Encode data as UTF-8 JSON bytes. Uses orjson if it is installed.
+    Data that orjson cannot encode (such as integers outside the 64-bit range) is encoded
+    with the stdlib json module instead.
+
+    :param data:
+    :return:
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data).encode('utf-8')
+
+
+# Only request bodies up to this many bytes are kept in the table request cache
+_TABLE_REQUEST_CACHE_MAX_BODY_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=256)
+def _load_table_request(schema, body):
+    """
+    Load and dump a table request body against a shared schema instance.
+    Table views re-send the same request body on every refresh, so the results are cached.
+
+    :param schema:
+    :param body:
+    :return:
+    """
+    return schema.dump(schema.load(json_loads(body)))
+
 
 class BaseApiError(Exception):
     """
@@ -56,6 +114,30 @@ class BaseApiError(Exception):
         Exception.__init__(self, errmsg)
 
 
+def api_endpoint(func):
+    """
+    Decorator for BaseApiHandler endpoint methods.
+
+    A BaseApiError is logged. The error response has already been written by the method that raised it.
+    Any other exception is returned as an internal error.
+
+    :param func:
+    :return:
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        except BaseApiError as bae:
+            tornado.log.app_log.error("BaseApiError.{}: {}".format(self.route.get('call_method'), str(bae)))
+        except Exception as e:
+            self.set_status(self.STATUS_ERROR_INTERNAL, reason=str(e))
+            self.write_error()
+
+    return wrapper
+
+
 class BaseApiHandler(RequestHandler):
     api_version = 2
     routes = []
@@ -89,20 +171,83 @@ class BaseApiHandler(RequestHandler):
         """
         # Ensure body can be JSON decoded
         try:
-            json_data = json.loads(self.request.body)
+            json_data = json_loads(self.request.body)
         except JSONDecodeError as e:
             self.set_status(self.STATUS_ERROR_EXTERNAL, reason=str(e))
             self.write_error()
             raise BaseApiError("Expected request body to be JSON. Received '{}'".format(self.request.body))
 
-        request_validation_errors = schema.validate(json_data)
-        if request_validation_errors:
+        # Load the request data in a single pass.
+        # Calling schema.validate() first would run the full deserialization twice.
+        try:
+            request_data = schema.load(json_data)
+        except exceptions.ValidationError as e:
+            request_validation_errors = e.messages
             self.error_messages = request_validation_errors
             self.set_status(self.STATUS_ERROR_EXTERNAL, reason="Failed request schema validation")
             self.write_error()
             raise BaseApiError("Failed schema validation: {}".format(str(request_validation_errors)))
 
-        return schema.dump(schema.load(json_data))
+        return schema.dump(request_data)
+
+    def read_table_request(self, schema: Schema):
+        """
+        Read a table data request body.
+        Results for a previously seen request body are returned from a cache.
+        Large request bodies, and anything that fails to load, go through 'read_json_request()' instead.
+        This keeps large bodies out of the cache and reports errors the same way.
+
+        :param schema: A shared schema instance from 'get_schema()'
+        :type schema: RequestTableDataSchema descendant
+        :return:
+        """
+        if len(self.request.body) > _TABLE_REQUEST_CACHE_MAX_BODY_SIZE:
+            return self.read_json_request(schema)
+        try:
+            return dict(_load_table_request(schema, self.request.body))
+        except (ValueError, exceptions.ValidationError):
+            return self.read_json_request(schema)
+
+    def read_id_list_request(self, schema: Schema):
+        """
+        Read a request body of the form {"id_list": [1, 2, 3]} and return the list of IDs.
+
+        :param schema:
+        :type schema: RequestTableUpdateByIdList descendant
+        :return:
+        """
+        return self.read_json_request_with_id_list(schema).get('id_list', [])
+
+    def read_json_request_with_id_list(self, schema: Schema):
+        """
+        Read a request body that contains an 'id_list' of table IDs.
+
+        A well-formed 'id_list' is only checked against the field's own validators (eg. its length),
+        rather than being loaded through the schema one item at a time. Any other fields are still loaded by the schema.
+        Anything else falls back to 'read_json_request()' so that errors are reported the same way.
+
+        :param schema:
+        :type schema: RequestTableUpdateByIdList descendant
+        :return:
+        """
+        try:
+            json_data = json_loads(self.request.body)
+        except ValueError:
+            json_data = None
+        if isinstance(json_data, dict):
+            id_list = json_data.get('id_list')
+            if isinstance(id_list, list) and all(type(item_id) is int for item_id in id_list):
+                other_data = {key: value for key, value in json_data.items() if key != 'id_list'}
+                try:
+                    for validator in schema.fields['id_list'].validators:
+                        validator(id_list)
+                    request_data = schema.dump(schema.load(other_data, partial=('id_list',)))
+                except exceptions.ValidationError:
+                    pass
+                else:
+                    request_data['id_list'] = id_list
+                    return request_data
+        return self.read_json_request(schema)
 
     def build_response(self, schema: Schema, response):
         """
@@ -126,6 +271,21 @@ class BaseApiHandler(RequestHandler):
         data = schema.dump(response)
         return data
 
+    def build_table_response(self, schema: Schema, response):
+        """
+        Same as 'build_response()', but the 'results' list of table rows is passed through as-is.
+        Only the rest of the response is validated and serialized by the Schema.
+        Use this only where the rows are already JSON safe and already match the Schema's results fields.
+
+        :param schema:
+        :param response:
+        :return:
+        """
+        results = response.get('results', [])
+        data = self.build_response(schema, dict(response, results=[]))
+        data['results'] = results
+        return data
+
     def write_success(self, response=None):
         """
         Write data out as HTTP code 200
@@ -137,7 +297,68 @@ class BaseApiHandler(RequestHandler):
         if response is None:
             response = {'success': True}
         self.set_status(self.STATUS_SUCCESS)
-        self.finish(response)
+        self.finish_json(response)
+
+    def write_success_body(self, body, etag):
+        """
+        Write out a response body that has already been serialized with 'encode_json()' as HTTP code 200.
+        If the request's If-None-Match header matches the given ETag, a 304 with no body is sent instead.
+        Finishes this response, ending the HTTP request.
+
+        :param body:
+        :param etag: The ETag returned by 'compute_body_etag()' for this body
+        :return:
+        """
+        self.set_status(self.STATUS_SUCCESS)
+        # Setting the ETag here stops tornado from hashing the body again on every request
+        self.set_header("Etag", etag)
+        if self.check_etag_header():
+            self.set_status(304)
+            self.finish()
+            return
+        self.finish_json_body(body)
+
+    @staticmethod
+    def compute_body_etag(body):
+        """
+        Return an ETag for a serialized response body. This matches tornado's default 'compute_etag()'.
+
+        :param body:
+        :return:
+        """
+        return '"{}"'.format(hashlib.sha1(body).hexdigest())
+
+    @staticmethod
+    def encode_json(response):
+        """
+        Serialize the given response as JSON bytes, ready to be written out with 'finish_json_body()'.
+
+        :param response:
+        :return:
+        """
+        # Match tornado's json_encode() in escaping "</" (for JSON which may be embedded in a <script> tag)
+        return json_dumps(response).replace(b"</", b"<\\/")
+
+    def finish_json(self, response):
+        """
+        Serialize the given response as JSON and write it out.
+        Finishes this response, ending the HTTP request.
+
+        :param response:
+        :return:
+        """
+        self.finish_json_body(self.encode_json(response))
+
+    def finish_json_body(self, body):
+        """
+        Write out a response body that has already been serialized with 'encode_json()'.
+        Finishes this response, ending the HTTP request.
+
+        :param body:
+        :return:
+        """
+        self.set_header("Content-Type", "application/json; charset=UTF-8")
+        self.finish(body)
 
     def write_error(self, status_code=None, **kwargs: Any) -> None:
         """
@@ -176,7 +397,7 @@ class BaseApiHandler(RequestHandler):
                 for line in traceback.format_exception(*exc_info):
                     traceback_lines.append(line)
             response['traceback'] = traceback_lines
-        self.finish(response)
+        self.finish_json(response)
 
     def handle_endpoint_not_found(self):
         """
@@ -189,7 +410,7 @@ class BaseApiHandler(RequestHandler):
             'error': "%(code)d: Endpoint not found" % {"code": self.STATUS_ERROR_ENDPOINT_NOT_FOUND}
         }
         self.set_status(self.STATUS_ERROR_ENDPOINT_NOT_FOUND)
-        self.finish(response)
+        self.finish_json(response)
 
     def handle_method_not_allowed(self):
         """
@@ -205,7 +426,54 @@ class BaseApiHandler(RequestHandler):
             }
         }
         self.set_status(self.STATUS_ERROR_METHOD_NOT_ALLOWED)
-        self.finish(response)
+        self.finish_json(response)
+
+    @classmethod
+    def _compiled_routes(cls, request_api_base):
+        """
+        Return this handler's routes compiled against the given API base path.
+        These are built once per handler class and API base path.
+
+        Routes with a literal path are indexed by that path. Only routes with
+        a regex path pattern need to be matched against each request.
+
+        :param request_api_base:
+        :return:
+        """
+        compiled_routes = cls.__dict__.get('_route_cache')
+        if compiled_routes is None:
+            compiled_routes = {}
+            cls._route_cache = compiled_routes
+        if request_api_base not in compiled_routes:
+            literal_routes = {}
+            pattern_routes = []
+            for index, route in enumerate(cls.routes):
+                path_pattern = request_api_base + route.get("path_pattern")
+                if re.search(r'[\\.^$*+?{}\[\]|()]', route.get("path_pattern")):
+                    pattern_routes.append((index, route, tornado.routing.PathMatches(path_pattern)))
+                else:
+                    literal_routes.setdefault(path_pattern, []).append((index, route, None))
+            compiled_routes[request_api_base] = (literal_routes, pattern_routes)
+        return compiled_routes[request_api_base]
+
+    @classmethod
+    def resolve_route(cls, request_api_base, path):
+        """
+        Return a list of (index, route, path_match) tuples for the routes matching the given path.
+        These are returned in the order that they are configured in this handler's routes.
+        'path_match' will be None for routes with a literal path.
+
+        :param request_api_base:
+        :param path:
+        :return:
+        """
+        literal_routes, pattern_routes = cls._compiled_routes(request_api_base)
+        matched_routes = literal_routes.get(path, [])
+        if pattern_routes:
+            matched_pattern_routes = [r for r in pattern_routes if r[2].regex.match(path)]
+            if matched_pattern_routes:
+                matched_routes = sorted(matched_routes + matched_pattern_routes, key=lambda r: r[0])
+        return matched_routes
 
     def action_route(self):
         """
@@ -219,42 +487,38 @@ class BaseApiHandler(RequestHandler):
         request_api_base = self.request.uri.split('api/v2')[0] + 'api/v2'
         # request_api_endpoint = re.sub('^/(unmanic/)*api/v\d', '', self.request.uri)
         matched_route_with_unsupported_method = False
-        for route in self.routes:
+        for index, route, path_match in self.resolve_route(request_api_base, self.request.path):
             # Get supported methods
             supported_methods = route.get("supported_methods", [])
 
-            # Fetch the path match from this route's path pattern
-            path_pattern = request_api_base + route.get("path_pattern")
-            path_match = tornado.routing.PathMatches(path_pattern)
-            if path_match.regex.match(self.request.path):
-                # Check if this endpoint supports the request HTTP method
-                if self.request.method not in supported_methods:
-                    # The request's method is not supported by this route.
-                    # Mark as having found a matching route, but with an un-supported HTTP method
-                    matched_route_with_unsupported_method = True
-                    continue
-
-                # Check if the path matches, and get any params from a match
-                params = path_match.match(self.request)
-
-                # If we have a match and were returned some params, load that method
-                if params:
-                    tornado.log.app_log.debug(
-                        "Routing API to {}.{}(*args={}, **kwargs={})".format(self.__class__.__name__,
-                                                                             route.get("call_method"), params["path_args"],
-                                                                             params["path_kwargs"]), exc_info=True)
-
-                    getattr(self, route.get("call_method"))(*params["path_args"], **params["path_kwargs"])
-                    return
-
-                # This route matches the current request URI and does not have any params.
-                # Set this route and call the configured method.
-                tornado.log.app_log.debug("Routing API to {}.{}()".format(self.__class__.__name__, route.get("call_method")),
-                                          exc_info=True)
-                self.route = route
-                getattr(self, route.get("call_method"))()
+            # Check if this endpoint supports the request HTTP method
+            if self.request.method not in supported_methods:
+                # The request's method is not supported by this route.
+                # Mark as having found a matching route, but with an un-supported HTTP method
+                matched_route_with_unsupported_method = True
+                continue
+
+            # Check if the path matches, and get any params from a match
+            params = path_match.match(self.request) if path_match else None
+
+            # If we have a match and were returned some params, load that method
+            if params:
+                tornado.log.app_log.debug(
+                    "Routing API to {}.{}(*args={}, **kwargs={})".format(self.__class__.__name__,
+                                                                         route.get("call_method"), params["path_args"],
+                                                                         params["path_kwargs"]), exc_info=True)
+
+                getattr(self, route.get("call_method"))(*params["path_args"], **params["path_kwargs"])
                 return
 
+            # This route matches the current request URI and does not have any params.
+            # Set this route and call the configured method.
+            tornado.log.app_log.debug("Routing API to {}.{}()".format(self.__class__.__name__, route.get("call_method")),
+                                      exc_info=True)
+            self.route = route
+            getattr(self, route.get("call_method"))()
+            return
+
         # If we got this far, then the URI does not match any of our configured routes.
         if matched_route_with_unsupported_method:
             tornado.log.app_log.warning("Method not allowed for API route: {}".format(self.request.uri), exc_info=True)
@@ -29,13 +29,11 @@
            OR OTHER DEALINGS IN THE SOFTWARE.
 
 """
-import os
-
 import tornado.log
 from unmanic.libs import session
 from unmanic.libs.uiserver import UnmanicDataQueues
 from unmanic.webserver.api_v2.base_api_handler import BaseApiHandler, BaseApiError
-from unmanic.webserver.api_v2.schema.schemas import DocumentContentSuccessSchema
+from unmanic.webserver.api_v2.schema.schemas import DocumentContentSuccessSchema, get_schema
 from unmanic.webserver.helpers import documents
 
 
@@ -102,18 +100,14 @@ class ApiDocsHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            privacy_policy_content = []
-            privacy_policy_file = os.path.join(os.path.dirname(__file__), '..', 'docs', 'privacy_policy.md')
-            if os.path.exists(privacy_policy_file):
-                with open(privacy_policy_file, 'r') as f:
-                    privacy_policy_content = f.readlines()
+            privacy_policy_content = list(documents.read_privacy_policy())
             if not privacy_policy_content:
                 self.set_status(self.STATUS_ERROR_INTERNAL, reason="Unable to read privacy policy.")
                 self.write_error()
                 return
             else:
                 response = self.build_response(
-                    DocumentContentSuccessSchema(),
+                    get_schema(DocumentContentSuccessSchema),
                     {
                         "content": privacy_policy_content,
                     }
@@ -169,7 +163,7 @@ class ApiDocsHandler(BaseApiHandler):
             log_files_zip_path = documents.generate_log_files_zip()
 
             with open(log_files_zip_path, "rb") as f:
-                for chunk in iter(lambda: f.read(8192), b''):
+                for chunk in iter(lambda: f.read(65536), b''):
                     self.write(chunk)
 
             self.set_header('Content-Type', 'application/octet-stream')
@@ -36,7 +36,7 @@ from unmanic.libs import session
 from unmanic.libs.uiserver import UnmanicDataQueues
 from unmanic.webserver.api_v2.base_api_handler import BaseApiHandler, BaseApiError
 from unmanic.webserver.api_v2.schema.schemas import DirectoryListingResultsSchema, DocumentContentSuccessSchema, \
-    RequestDirectoryListingDataSchema
+    RequestDirectoryListingDataSchema, get_schema
 from unmanic.webserver.helpers.filebrowser import DirectoryListing
 
 
@@ -104,13 +104,13 @@ class ApiFilebrowserHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestDirectoryListingDataSchema())
+            json_request = self.read_json_request(get_schema(RequestDirectoryListingDataSchema))
 
             directory_listing = DirectoryListing(json_request.get('list_type', 'all'))
             path_data = directory_listing.fetch_path_data(json_request.get('current_path', '/'))
 
             response = self.build_response(
-                DirectoryListingResultsSchema(),
+                get_schema(DirectoryListingResultsSchema),
                 {
                     'directories': path_data.get('directories', []),
                     'files':       path_data.get('files', []),
@@ -37,9 +37,8 @@ from unmanic.libs import session
 from unmanic.libs.uiserver import UnmanicDataQueues
 from unmanic.webserver.api_v2.base_api_handler import BaseApiError, BaseApiHandler
 from unmanic.webserver.api_v2.schema.schemas import CompletedTasksLogRequestSchema, CompletedTasksLogSchema, \
-    CompletedTasksSchema, \
-    RequestHistoryTableDataSchema, \
-    RequestAddCompletedToPendingTasksSchema, RequestTableUpdateByIdList
+    CompletedTasksSchema, RequestHistoryTableDataSchema, RequestAddCompletedToPendingTasksSchema, \
+    RequestTableUpdateByIdList, get_schema
 from unmanic.webserver.helpers import completed_tasks
 
 
@@ -124,7 +123,7 @@ class ApiHistoryHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestHistoryTableDataSchema())
+            json_request = self.read_table_request(get_schema(RequestHistoryTableDataSchema))
 
             params = {
                 'start':        json_request.get('start'),
@@ -140,14 +139,18 @@ class ApiHistoryHandler(BaseApiHandler):
             }
             task_list = completed_tasks.prepare_filtered_completed_tasks(params)
 
-            response = self.build_response(
-                CompletedTasksSchema(),
+            # Each row only differs from its CompletedTasksTableResultsSchema dump by the type of 'finish_time'.
+            # Convert that here rather than dumping every row through the schema.
+            results = [dict(task, finish_time=int(task['finish_time'])) for task in task_list.get('results')]
+
+            response = self.build_table_response(
+                get_schema(CompletedTasksSchema),
                 {
                     "recordsTotal":    task_list.get('recordsTotal'),
                     "recordsFiltered": task_list.get('recordsFiltered'),
                     "successCount":    task_list.get('successCount'),
                     "failedCount":     task_list.get('failedCount'),
-                    "results":         task_list.get('results'),
+                    "results":         results,
                 }
             )
             self.write_success(response)
@@ -204,7 +207,7 @@ class ApiHistoryHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestTableUpdateByIdList())
+            json_request = self.read_json_request_with_id_list(get_schema(RequestTableUpdateByIdList))
 
             if not completed_tasks.remove_completed_tasks(json_request.get('id_list', [])):
                 self.set_status(self.STATUS_ERROR_INTERNAL, reason="Failed to delete the completed tasks by their IDs")
@@ -265,7 +268,7 @@ class ApiHistoryHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestAddCompletedToPendingTasksSchema())
+            json_request = self.read_json_request_with_id_list(get_schema(RequestAddCompletedToPendingTasksSchema))
             id_list = json_request.get('id_list', [])
             library_id = json_request.get('library_id')
 
@@ -336,12 +339,12 @@ class ApiHistoryHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(CompletedTasksLogRequestSchema())
+            json_request = self.read_json_request(get_schema(CompletedTasksLogRequestSchema))
 
             command_log = completed_tasks.read_command_log_for_task(json_request.get('task_id'))
 
             response = self.build_response(
-                CompletedTasksLogSchema(),
+                get_schema(CompletedTasksLogSchema),
                 {
                     'command_log':       command_log.get('command_log', ''),
                     'command_log_lines': command_log.get('command_log_lines', []),
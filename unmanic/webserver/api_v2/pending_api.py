@@ -37,7 +37,7 @@ from unmanic.libs.uiserver import UnmanicDataQueues
 from unmanic.webserver.api_v2.base_api_handler import BaseApiHandler, BaseApiError
 from unmanic.webserver.api_v2.schema.schemas import PendingTasksTableResultsSchema, RequestPendingTaskCreateSchema, \
     RequestPendingTasksLibraryUpdateSchema, RequestPendingTasksReorderSchema, PendingTasksSchema, \
-    RequestPendingTableDataSchema, RequestTableUpdateByIdList, TaskDownloadLinkSchema
+    RequestPendingTableDataSchema, RequestTableUpdateByIdList, TaskDownloadLinkSchema, get_schema
 from unmanic.webserver.downloads import DownloadsLinks
 from unmanic.webserver.helpers import pending_tasks
 
@@ -152,7 +152,7 @@ class ApiPendingHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestPendingTableDataSchema())
+            json_request = self.read_table_request(get_schema(RequestPendingTableDataSchema))
 
             params = {
                 'start':        json_request.get('start', '0'),
@@ -165,8 +165,8 @@ class ApiPendingHandler(BaseApiHandler):
             }
             task_list = pending_tasks.prepare_filtered_pending_tasks(params, include_library=True)
 
-            response = self.build_response(
-                PendingTasksSchema(),
+            response = self.build_table_response(
+                get_schema(PendingTasksSchema),
                 {
                     "recordsTotal":    task_list.get('recordsTotal'),
                     "recordsFiltered": task_list.get('recordsFiltered'),
@@ -227,7 +227,7 @@ class ApiPendingHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestTableUpdateByIdList())
+            json_request = self.read_json_request_with_id_list(get_schema(RequestTableUpdateByIdList))
 
             if not pending_tasks.remove_pending_tasks(json_request.get('id_list', [])):
                 self.set_status(self.STATUS_ERROR_INTERNAL, reason="Failed to delete the pending tasks by their IDs")
@@ -304,7 +304,7 @@ class ApiPendingHandler(BaseApiHandler):
         """
         Pending - reorder
         ---
-        description: Reorder a list of pending tasks.
+        description: Reorder a list of pending tasks. The whole list is reordered in a single request.
         requestBody:
             description: Requested list of items to reorder.
             required: True
@@ -345,7 +345,7 @@ class ApiPendingHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestPendingTasksReorderSchema())
+            json_request = self.read_json_request_with_id_list(get_schema(RequestPendingTasksReorderSchema))
 
             if not pending_tasks.reorder_pending_tasks(json_request.get('id_list', []), json_request.get('position', 'top')):
                 self.set_status(self.STATUS_ERROR_INTERNAL, reason="Failed to save new order")
@@ -406,7 +406,7 @@ class ApiPendingHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestPendingTaskCreateSchema())
+            json_request = self.read_json_request(get_schema(RequestPendingTaskCreateSchema))
 
             abspath = os.path.abspath(json_request.get('path', ''))
             library_id = json_request.get('library_id', 1)
@@ -435,7 +435,7 @@ class ApiPendingHandler(BaseApiHandler):
                 return
 
             # Return the details of the generated task
-            response = self.build_response(PendingTasksTableResultsSchema(), task_info)
+            response = self.build_response(get_schema(PendingTasksTableResultsSchema), task_info)
             self.write_success(response)
             return
         except BaseApiError as bae:
@@ -490,7 +490,7 @@ class ApiPendingHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestTableUpdateByIdList())
+            json_request = self.read_json_request_with_id_list(get_schema(RequestTableUpdateByIdList))
 
             status_results = pending_tasks.fetch_tasks_status(json_request.get('id_list', []))
             if not status_results:
@@ -499,7 +499,7 @@ class ApiPendingHandler(BaseApiHandler):
                 return
 
             response = self.build_response(
-                PendingTasksSchema(),
+                get_schema(PendingTasksSchema),
                 {
                     "results": status_results,
                 }
@@ -558,7 +558,7 @@ class ApiPendingHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestTableUpdateByIdList())
+            json_request = self.read_json_request_with_id_list(get_schema(RequestTableUpdateByIdList))
 
             if not pending_tasks.update_pending_tasks_status(json_request.get('id_list', []), status='pending'):
                 self.set_status(self.STATUS_ERROR_INTERNAL, reason="Failed to update pending tasks status")
@@ -619,7 +619,7 @@ class ApiPendingHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestPendingTasksLibraryUpdateSchema())
+            json_request = self.read_json_request_with_id_list(get_schema(RequestPendingTasksLibraryUpdateSchema))
 
             id_list = json_request.get('id_list', [])
             library_name = json_request.get('library_name')
@@ -695,7 +695,7 @@ class ApiPendingHandler(BaseApiHandler):
             link_id = download_links.generate_download_link(link_data)
 
             response = self.build_response(
-                TaskDownloadLinkSchema(),
+                get_schema(TaskDownloadLinkSchema),
                 {
                     "link_id": link_id,
                 }
@@ -772,7 +772,7 @@ class ApiPendingHandler(BaseApiHandler):
             link_id = download_links.generate_download_link(link_data)
 
             response = self.build_response(
-                TaskDownloadLinkSchema(),
+                get_schema(TaskDownloadLinkSchema),
                 {
                     "link_id": link_id,
                 }
@@ -31,6 +31,13 @@
 """
 from marshmallow import Schema, fields, validate
 
+# Shared field validators. These are stateless, so one instance is used by every field that needs it
+_MIN_LENGTH_0 = validate.Length(min=0)
+_MIN_LENGTH_1 = validate.Length(min=1)
+_BULK_ID_LIST_LENGTH = validate.Length(min=1, max=10000)
+_ORDER_DIRECTION = validate.OneOf(["asc", "desc"])
+_POSITION = validate.OneOf(["top", "bottom"])
+
 
 class BaseSchema(Schema):
     class Meta:
@@ -43,30 +50,38 @@ class BaseSchema(Schema):
 class BaseSuccessSchema(BaseSchema):
     success = fields.Boolean(
         required=True,
-        description='This is always "True" when a request succeeds',
-        example=True,
+        metadata={
+            "description": 'This is always "True" when a request succeeds',
+            "example":     True,
+        },
     )
 
 
 class BaseErrorSchema(BaseSchema):
     error = fields.Str(
         required=True,
-        description="Return status code and reason",
+        metadata={
+            "description": "Return status code and reason",
+        },
     )
     messages = fields.Dict(
         required=True,
-        description="Attached request body validation errors",
-        example={"name": ["The thing that went wrong."]},
+        metadata={
+            "description": "Attached request body validation errors",
+            "example":     {"name": ["The thing that went wrong."]},
+        },
     )
     traceback = fields.List(
         cls_or_instance=fields.Str,
         required=False,
-        description="Attached exception traceback (if developer mode is enabled)",
-        example=[
-            "Traceback (most recent call last):\n",
-            "...",
-            "json.decoder.JSONDecodeError: Expecting value: line 3 column 14 (char 45)\n"
-        ],
+        metadata={
+            "description": "Attached exception traceback (if developer mode is enabled)",
+            "example":     [
+                "Traceback (most recent call last):\n",
+                "...",
+                "json.decoder.JSONDecodeError: Expecting value: line 3 column 14 (char 45)\n"
+            ],
+        },
     )
 
 
@@ -74,8 +89,10 @@ class BadRequestSchema(BaseErrorSchema):
     """STATUS_ERROR_EXTERNAL = 400"""
     error = fields.Str(
         required=True,
-        description="Return status code and reason",
-        example="400: Failed request schema validation",
+        metadata={
+            "description": "Return status code and reason",
+            "example":     "400: Failed request schema validation",
+        },
     )
 
 
@@ -83,8 +100,10 @@ class BadEndpointSchema(BaseSchema):
     """STATUS_ERROR_ENDPOINT_NOT_FOUND = 404"""
     error = fields.Str(
         required=True,
-        description="Return status code and reason",
-        example="404: Endpoint not found",
+        metadata={
+            "description": "Return status code and reason",
+            "example":     "404: Endpoint not found",
+        },
     )
 
 
@@ -92,8 +111,10 @@ class BadMethodSchema(BaseSchema):
     """STATUS_ERROR_METHOD_NOT_ALLOWED = 405"""
     error = fields.Str(
         required=True,
-        description="Return status code and reason",
-        example="405: Method 'GET' not allowed",
+        metadata={
+            "description": "Return status code and reason",
+            "example":     "405: Method 'GET' not allowed",
+        },
     )
 
 
@@ -101,8 +122,10 @@ class InternalErrorSchema(BaseErrorSchema):
     """STATUS_ERROR_INTERNAL = 500"""
     error = fields.Str(
         required=True,
-        description="Return status code and reason",
-        example="500: Caught exception message",
+        metadata={
+            "description": "Return status code and reason",
+            "example":     "500: Caught exception message",
+        },
     )
 
 
@@ -114,51 +137,67 @@ class RequestTableDataSchema(BaseSchema):
 
     start = fields.Int(
         required=False,
-        description="Start row number to select from",
-        example=0,
+        metadata={
+            "description": "Start row number to select from",
+            "example":     0,
+        },
         load_default=0,
     )
     length = fields.Int(
         required=False,
-        description="Number of rows to select",
-        example=10,
+        metadata={
+            "description": "Number of rows to select",
+            "example":     10,
+        },
         load_default=10,
     )
     search_value = fields.Str(
         required=False,
-        description="String to filter search results by",
-        example="items with this text in the value",
+        metadata={
+            "description": "String to filter search results by",
+            "example":     "items with this text in the value",
+        },
         load_default="",
     )
     status = fields.Str(
         required=False,
-        description="Filter on the status",
-        example="all",
+        metadata={
+            "description": "Filter on the status",
+            "example":     "all",
+        },
         load_default="all",
     )
     after = fields.DateTime(
         required=False,
-        description="Filter entries since datetime",
-        example="2022-04-07 01:45",
+        metadata={
+            "description": "Filter entries since datetime",
+            "example":     "2022-04-07 01:45",
+        },
         allow_none=True,
     )
     before = fields.DateTime(
         required=False,
-        description="Filter entries prior to datetime",
-        example="2022-04-07 01:55",
+        metadata={
+            "description": "Filter entries prior to datetime",
+            "example":     "2022-04-07 01:55",
+        },
         allow_none=True,
     )
     order_by = fields.Str(
         required=False,
-        description="Column to order results by",
-        example="finish_time",
+        metadata={
+            "description": "Column to order results by",
+            "example":     "finish_time",
+        },
         load_default="",
     )
     order_direction = fields.Str(
         required=False,
-        description="Order direction ('asc' or 'desc')",
-        example="desc",
-        validate=validate.OneOf(["asc", "desc"]),
+        metadata={
+            "description": "Order direction ('asc' or 'desc')",
+            "example":     "desc",
+        },
+        validate=_ORDER_DIRECTION,
     )
 
 
@@ -168,9 +207,11 @@ class RequestTableUpdateByIdList(BaseSchema):
     id_list = fields.List(
         cls_or_instance=fields.Int,
         required=True,
-        description="List of table IDs",
-        example=[],
-        validate=validate.Length(min=1),
+        metadata={
+            "description": "List of table IDs",
+            "example":     [],
+        },
+        validate=_MIN_LENGTH_1,
     )
 
 
@@ -179,20 +220,26 @@ class TableRecordsSuccessSchema(BaseSchema):
 
     recordsTotal = fields.Int(
         required=False,
-        description="Total number of records in this table",
-        example=329,
+        metadata={
+            "description": "Total number of records in this table",
+            "example":     329,
+        },
     )
     recordsFiltered = fields.Int(
         required=False,
-        description="Total number of records after filters have been applied",
-        example=10,
+        metadata={
+            "description": "Total number of records after filters have been applied",
+            "example":     10,
+        },
         load_default=10,
     )
     results = fields.List(
         cls_or_instance=fields.Raw,
         required=False,
-        description="Results",
-        example=[],
+        metadata={
+            "description": "Results",
+            "example":     [],
+        },
     )
 
 
@@ -201,8 +248,10 @@ class RequestDatabaseItemByIdSchema(BaseSchema):
 
     id = fields.Int(
         required=True,
-        description="The ID of the table item",
-        example=1,
+        metadata={
+            "description": "The ID of the table item",
+            "example":     1,
+        },
     )
 
 
@@ -215,13 +264,15 @@ class DocumentContentSuccessSchema(BaseSchema):
     content = fields.List(
         cls_or_instance=fields.Str,
         required=True,
-        description="Document contents read line-by-line into a list",
-        example=[
-            "First line\n",
-            "Second line\n",
-            "\n",
-        ],
-        validate=validate.Length(min=1),
+        metadata={
+            "description": "Document contents read line-by-line into a list",
+            "example":     [
+                "First line\n",
+                "Second line\n",
+                "\n",
+            ],
+        },
+        validate=_MIN_LENGTH_1,
     )
 
 
@@ -232,11 +283,15 @@ class RequestDirectoryListingDataSchema(BaseSchema):
     """Schema for requesting a directory content listing"""
 
     current_path = fields.Str(
-        example="/",
+        metadata={
+            "example": "/",
+        },
         load_default="/",
     )
     list_type = fields.Str(
-        example="directories",
+        metadata={
+            "example": "directories",
+        },
         load_default="all",
     )
 
@@ -247,34 +302,38 @@ class DirectoryListingResultsSchema(BaseSchema):
     directories = fields.List(
         cls_or_instance=fields.Dict,
         required=True,
-        description="A list of directories in the given path",
-        example=[
-            {
-                'value': "home",
-                'label': "/home",
-            },
-            {
-                'value': "tmp",
-                'label': "/tmp",
-            },
-        ],
-        validate=validate.Length(min=0),
+        metadata={
+            "description": "A list of directories in the given path",
+            "example":     [
+                {
+                    'value': "home",
+                    'label': "/home",
+                },
+                {
+                    'value': "tmp",
+                    'label': "/tmp",
+                },
+            ],
+        },
+        validate=_MIN_LENGTH_0,
     )
     files = fields.List(
         cls_or_instance=fields.Dict,
         required=True,
-        description="A list of files in the given path",
-        example=[
-            {
-                'value': "file1.txt",
-                'label': "/file1.txt",
-            },
-            {
-                'value': "file2.txt",
-                'label': "/file2.txt",
-            },
-        ],
-        validate=validate.Length(min=0),
+        metadata={
+            "description": "A list of files in the given path",
+            "example":     [
+                {
+                    'value': "file1.txt",
+                    'label': "/file1.txt",
+                },
+                {
+                    'value': "file2.txt",
+                    'label': "/file2.txt",
+                },
+            ],
+        },
+        validate=_MIN_LENGTH_0,
     )
 
 
@@ -285,7 +344,9 @@ class RequestHistoryTableDataSchema(RequestTableDataSchema):
     """Schema for requesting completed tasks from the table"""
 
     order_by = fields.Str(
-        example="finish_time",
+        metadata={
+            "example": "finish_time",
+        },
         load_default="finish_time",
     )
 
@@ -295,23 +356,31 @@ class CompletedTasksTableResultsSchema(BaseSchema):
 
     id = fields.Int(
         required=True,
-        description="Item ID",
-        example=1,
+        metadata={
+            "description": "Item ID",
+            "example":     1,
+        },
     )
     task_label = fields.Str(
         required=True,
-        description="Item label",
-        example="example.mp4",
+        metadata={
+            "description": "Item label",
+            "example":     "example.mp4",
+        },
     )
     task_success = fields.Boolean(
         required=True,
-        description="Item success status",
-        example=True,
+        metadata={
+            "description": "Item success status",
+            "example":     True,
+        },
     )
     finish_time = fields.Int(
         required=True,
-        description="Item finish time",
-        example=1627392616.6400812,
+        metadata={
+            "description": "Item finish time (whole seconds since the epoch)",
+            "example":     1627392616,
+        },
     )
 
 
@@ -320,20 +389,26 @@ class CompletedTasksSchema(TableRecordsSuccessSchema):
 
     successCount = fields.Int(
         required=True,
-        description="Total count of times with a success status in the results list",
-        example=337,
+        metadata={
+            "description": "Total count of times with a success status in the results list",
+            "example":     337,
+        },
     )
     failedCount = fields.Int(
         required=True,
-        description="Total count of times with a failed status in the results list",
-        example=2,
+        metadata={
+            "description": "Total count of times with a failed status in the results list",
+            "example":     2,
+        },
     )
     results = fields.Nested(
         CompletedTasksTableResultsSchema,
         required=True,
-        description="Results",
+        metadata={
+            "description": "Results",
+        },
         many=True,
-        validate=validate.Length(min=0),
+        validate=_MIN_LENGTH_0,
     )
 
 
@@ -342,8 +417,10 @@ class CompletedTasksLogRequestSchema(BaseSchema):
 
     task_id = fields.Int(
         required=True,
-        description="The ID of the task",
-        example=1,
+        metadata={
+            "description": "The ID of the task",
+            "example":     1,
+        },
     )
 
 
@@ -352,22 +429,26 @@ class CompletedTasksLogSchema(BaseSchema):
 
     command_log = fields.Str(
         required=True,
-        description="Long string...",
-        example='Long string...',
+        metadata={
+            "description": "Long string...",
+            "example":     'Long string...',
+        },
     )
     command_log_lines = fields.List(
         cls_or_instance=fields.Str,
         required=True,
-        description="The long string broken up into an array of lines",
-        example=[
-            "",
-            "<b>RUNNER: </b>",
-            "Video Encoder H264 - libx264 [Pass #1]",
-            "",
-            "<b>COMMAND:</b>",
-            "",
-            "...",
-        ],
+        metadata={
+            "description": "The long string broken up into an array of lines",
+            "example":     [
+                "",
+                "<b>RUNNER: </b>",
+                "Video Encoder H264 - libx264 [Pass #1]",
+                "",
+                "<b>COMMAND:</b>",
+                "",
+                "...",
+            ],
+        },
     )
 
 
@@ -377,7 +458,9 @@ class RequestAddCompletedToPendingTasksSchema(RequestTableUpdateByIdList):
     library_id = fields.Int(
         required=False,
         load_default=0,
-        example=1,
+        metadata={
+            "example": 1,
+        },
     )
 
 
@@ -388,7 +471,9 @@ class RequestPendingTableDataSchema(RequestTableDataSchema):
     """Schema for requesting pending tasks from the table"""
 
     order_by = fields.Str(
-        example="priority",
+        metadata={
+            "example": "priority",
+        },
         load_default="priority",
     )
 
@@ -398,43 +483,59 @@ class PendingTasksTableResultsSchema(BaseSchema):
 
     id = fields.Int(
         required=True,
-        description="Item ID",
-        example=1,
+        metadata={
+            "description": "Item ID",
+            "example":     1,
+        },
     )
     abspath = fields.Str(
         required=True,
-        description="File absolute path",
-        example="example.mp4",
+        metadata={
+            "description": "File absolute path",
+            "example":     "example.mp4",
+        },
     )
     priority = fields.Int(
         required=True,
-        description="The current priority (higher is greater)",
-        example=100,
+        metadata={
+            "description": "The current priority (higher is greater)",
+            "example":     100,
+        },
     )
     type = fields.Str(
         required=True,
-        description="The type of the pending task - local or remote",
-        example="local",
+        metadata={
+            "description": "The type of the pending task - local or remote",
+            "example":     "local",
+        },
     )
     status = fields.Str(
         required=True,
-        description="The current status of the pending task",
-        example="pending",
+        metadata={
+            "description": "The current status of the pending task",
+            "example":     "pending",
+        },
     )
     checksum = fields.Str(
         required=False,
-        description="The uploaded file md5 checksum",
-        example="5425ab3df5cdbad2e1099bb4cb963a4f",
+        metadata={
+            "description": "The uploaded file md5 checksum",
+            "example":     "5425ab3df5cdbad2e1099bb4cb963a4f",
+        },
     )
     library_id = fields.Int(
         required=False,
-        description="The ID of the library for which this task was created",
-        example=1,
+        metadata={
+            "description": "The ID of the library for which this task was created",
+            "example":     1,
+        },
     )
     library_name = fields.Str(
         required=False,
-        description="The name of the library for which this task was created",
-        example="Default",
+        metadata={
+            "description": "The name of the library for which this task was created",
+            "example":     "Default",
+        },
     )
 
 
@@ -444,20 +545,33 @@ class PendingTasksSchema(TableRecordsSuccessSchema):
     results = fields.Nested(
         PendingTasksTableResultsSchema,
         required=True,
-        description="Results",
+        metadata={
+            "description": "Results",
+        },
         many=True,
-        validate=validate.Length(min=0),
+        validate=_MIN_LENGTH_0,
     )
 
 
 class RequestPendingTasksReorderSchema(RequestTableUpdateByIdList):
     """Schema for moving pending items to top or bottom of table by ID"""
 
+    id_list = fields.List(
+        cls_or_instance=fields.Int,
+        required=True,
+        metadata={
+            "description": "List of table IDs to move in a single request (up to 10000)",
+            "example":     [],
+        },
+        validate=_BULK_ID_LIST_LENGTH,
+    )
     position = fields.Str(
         required=True,
-        description="Position to move given list of items to ('top' or 'bottom')",
-        example="top",
-        validate=validate.OneOf(["top", "bottom"]),
+        metadata={
+            "description": "Position to move given list of items to ('top' or 'bottom')",
+            "example":     "top",
+        },
+        validate=_POSITION,
     )
 
 
@@ -466,28 +580,39 @@ class RequestPendingTaskCreateSchema(BaseSchema):
 
     path = fields.Str(
         required=True,
-        description="The absolute path to a file",
-        example="/library/TEST_FILE.mkv",
+        metadata={
+            "description": "The absolute path to a file",
+            "example":     "/library/TEST_FILE.mkv",
+        },
     )
     library_id = fields.Int(
         required=False,
-        description="The ID of the library to append this task to",
-        example=1,
+        metadata={
+            "description": "The ID of the library to append this task to",
+            "example":     1,
+        },
     )
     library_name = fields.Str(
         required=False,
-        description="The name of the library to append this task to",
-        example='Default',
+        metadata={
+            "description": "The name of the library to append this task to",
+            "example":     'Default',
+        },
     )
     type = fields.Str(
         required=False,
-        description="The type of pending task to create (local/remote)",
-        example='local',
+        metadata={
+            "description": "The type of pending task to create (local/remote)",
+            "example":     'local',
+        },
     )
     priority_score = fields.Int(
         required=False,
-        description="Apply a priority score to the created task to either increase or decrease its position in the queue",
-        example=1000,
+        metadata={
+            "description": "Apply a priority score to the created task to either increase or decrease its position "
+                           "in the queue",
+            "example":     1000,
+        },
     )
 
 
@@ -496,8 +621,10 @@ class TaskDownloadLinkSchema(BaseSchema):
 
     link_id = fields.Str(
         required=True,
-        description="The ID used to download the file /unmanic/downloads/{link_id}",
-        example="2960645c-a4e2-4b05-8866-7bd469ee9ef8",
+        metadata={
+            "description": "The ID used to download the file /unmanic/downloads/{link_id}",
+            "example":     "2960645c-a4e2-4b05-8866-7bd469ee9ef8",
+        },
     )
 
 
@@ -506,7 +633,9 @@ class RequestPendingTasksLibraryUpdateSchema(RequestTableUpdateByIdList):
 
     library_name = fields.Str(
         required=True,
-        example='Default',
+        metadata={
+            "example": 'Default',
+        },
     )
 
 
@@ -517,7 +646,9 @@ class RequestPluginsTableDataSchema(RequestTableDataSchema):
     """Schema for requesting plugins from the table"""
 
     order_by = fields.Str(
-        example="name",
+        metadata={
+            "example": "name",
+        },
         load_default="name",
     )
 
@@ -525,13 +656,17 @@ class RequestPluginsTableDataSchema(RequestTableDataSchema):
 class PluginStatusSchema(BaseSchema):
     installed = fields.Boolean(
         required=False,
-        description="Is the plugin installed",
-        example=True,
+        metadata={
+            "description": "Is the plugin installed",
+            "example":     True,
+        },
     )
     update_available = fields.Boolean(
         required=False,
-        description="Does the plugin have an update available",
-        example=True,
+        metadata={
+            "description": "Does the plugin have an update available",
+            "example":     True,
+        },
     )
 
 
@@ -540,12 +675,16 @@ class RequestPluginsByIdSchema(BaseSchema):
 
     plugin_id = fields.Str(
         required=True,
-        example="encoder_video_hevc_vaapi",
+        metadata={
+            "example": "encoder_video_hevc_vaapi",
+        },
     )
     repo_id = fields.Str(
         required=False,
-        description="The ID of the repository that this plugin is in",
-        example="158899500680826593283708490873332175078",
+        metadata={
+            "description": "The ID of the repository that this plugin is in",
+            "example":     "158899500680826593283708490873332175078",
+        },
     )
 
 
@@ -554,53 +693,74 @@ class PluginsMetadataResultsSchema(BaseSchema):
 
     plugin_id = fields.Str(
         required=True,
-        description="The plugin ID",
-        example="encoder_video_h264_nvenc",
+        metadata={
+            "description": "The plugin ID",
+            "example":     "encoder_video_h264_nvenc",
+        },
     )
     name = fields.Str(
         required=True,
-        description="The plugin name",
-        example="Video Encoder H264 - h264_nvenc",
+        metadata={
+            "description": "The plugin name",
+            "example":     "Video Encoder H264 - h264_nvenc",
+        },
     )
     author = fields.Str(
         required=True,
-        description="The plugin author",
-        example="encoder_video_h264_nvenc",
+        metadata={
+            "description": "The plugin author",
+            "example":     "encoder_video_h264_nvenc",
+        },
     )
     description = fields.Str(
         required=True,
-        description="The plugin description",
-        example="Ensure all video streams are encoded with the H264 codec using the h264_nvenc encoder.",
+        metadata={
+            "description": "The plugin description",
+            "example":     "Ensure all video streams are encoded with the H264 codec using the h264_nvenc encoder.",
+        },
     )
     version = fields.Str(
         required=True,
-        description="The plugin version",
-        example="Josh.5",
+        metadata={
+            "description": "The plugin version",
+            "example":     "Josh.5",
+        },
     )
     icon = fields.Str(
         required=True,
-        description="The plugin icon",
-        example="https://raw.githubusercontent.com/Josh5/unmanic-plugins/master/source/encoder_video_h264_nvenc/icon.png",
+        metadata={
+            "description": "The plugin icon",
+            "example":     "https://raw.githubusercontent.com/Josh5/unmanic-plugins/master/source/"
+                           "encoder_video_h264_nvenc/icon.png",
+        },
     )
     tags = fields.Str(
         required=True,
-        description="The plugin tags",
-        example="video,encoder,ffmpeg,worker,nvenc,nvdec,nvidia",
+        metadata={
+            "description": "The plugin tags",
+            "example":     "video,encoder,ffmpeg,worker,nvenc,nvdec,nvidia",
+        },
     )
     status = fields.Nested(
         PluginStatusSchema,
         required=True,
-        description="The plugin status",
+        metadata={
+            "description": "The plugin status",
+        },
     )
     changelog = fields.Str(
         required=False,
-        description="The plugin changelog",
-        example="[b][color=56adda]0.0.1[/color][/b]• initial version",
+        metadata={
+            "description": "The plugin changelog",
+            "example":     "[b][color=56adda]0.0.1[/color][/b]• initial version",
+        },
     )
     has_config = fields.Boolean(
         required=False,
-        description="The plugin has the ability to be configured",
-        example=True,
+        metadata={
+            "description": "The plugin has the ability to be configured",
+            "example":     True,
+        },
     )
 
 
@@ -609,8 +769,10 @@ class PluginsTableResultsSchema(PluginsMetadataResultsSchema):
 
     id = fields.Int(
         required=True,
-        description="Item table ID",
-        example=1,
+        metadata={
+            "description": "Item table ID",
+            "example":     1,
+        },
     )
 
 
@@ -620,9 +782,11 @@ class PluginsDataSchema(TableRecordsSuccessSchema):
     results = fields.Nested(
         PluginsTableResultsSchema,
         required=True,
-        description="Results",
+        metadata={
+            "description": "Results",
+        },
         many=True,
-        validate=validate.Length(min=0),
+        validate=_MIN_LENGTH_0,
     )
 
 
@@ -632,12 +796,16 @@ class RequestPluginsInfoSchema(RequestPluginsByIdSchema):
     prefer_local = fields.Boolean(
         required=False,
         load_default=True,
-        example=True,
+        metadata={
+            "example": True,
+        },
     )
     library_id = fields.Int(
         required=False,
         load_default=0,
-        example=1,
+        metadata={
+            "example": 1,
+        },
     )
 
 
@@ -646,57 +814,73 @@ class PluginsConfigInputItemSchema(BaseSchema):
 
     key_id = fields.Str(
         required=True,
-        description="The config input base64 encoded key (used for linking keys containing spaces, etc.)",
-        example="c8f122656ed2acabde9b57101a4c8ec7",
+        metadata={
+            "description": "The config input base64 encoded key (used for linking keys containing spaces, etc.)",
+            "example":     "c8f122656ed2acabde9b57101a4c8ec7",
+        },
     )
     key = fields.Str(
         required=True,
-        description="The config input key or name",
-        example="downmix_dts_hd_ma",
+        metadata={
+            "description": "The config input key or name",
+            "example":     "downmix_dts_hd_ma",
+        },
     )
     value = fields.Raw(
         required=True,
-        description="The current value of this config input",
-        example=False,
+        metadata={
+            "description": "The current value of this config input",
+            "example":     False,
+        },
     )
     input_type = fields.Str(
         required=True,
-        description="The config input type",
-        example="checkbox",
+        metadata={
+            "description": "The config input type",
+            "example":     "checkbox",
+        },
     )
     label = fields.Str(
         required=True,
-        description="The label used to define this config input",
-        example="Downmix DTS-HD Master Audio (max 5.1 channels)?",
+        metadata={
+            "description": "The label used to define this config input",
+            "example":     "Downmix DTS-HD Master Audio (max 5.1 channels)?",
+        },
     )
     select_options = fields.List(
         cls_or_instance=fields.Dict,
         required=True,
-        description="Additional options if the input_type is set to 'select'",
-        example=[
-            {
-                'value': "first",
-                'label': "First Option",
-            },
-            {
-                'value': "second",
-                'label': "Second Option",
-            },
-        ],
+        metadata={
+            "description": "Additional options if the input_type is set to 'select'",
+            "example":     [
+                {
+                    'value': "first",
+                    'label': "First Option",
+                },
+                {
+                    'value': "second",
+                    'label': "Second Option",
+                },
+            ],
+        },
     )
     slider_options = fields.Dict(
         required=True,
-        description="Additional options if the input_type is set to 'slider'",
-        example={
-            "min":    1,
-            "max":    8,
-            "suffix": "M"
+        metadata={
+            "description": "Additional options if the input_type is set to 'slider'",
+            "example":     {
+                "min":    1,
+                "max":    8,
+                "suffix": "M"
+            },
         },
     )
     display = fields.Str(
         required=True,
-        description="Should the setting input be displayed (visible, hidden)",
-        example="visible",
+        metadata={
+            "description": "Should the setting input be displayed (visible, hidden)",
+            "example":     "visible",
+        },
     )
 
 
@@ -707,7 +891,9 @@ class PluginsInfoResultsSchema(PluginsMetadataResultsSchema):
         PluginsConfigInputItemSchema,
         required=False,
         many=True,
-        description="The plugin settings",
+        metadata={
+            "description": "The plugin settings",
+        },
     )
 
 
@@ -716,18 +902,24 @@ class RequestPluginsSettingsSaveSchema(BaseSchema):
 
     plugin_id = fields.Str(
         required=True,
-        example="encoder_video_hevc_vaapi",
+        metadata={
+            "example": "encoder_video_hevc_vaapi",
+        },
     )
     settings = fields.Nested(
         PluginsConfigInputItemSchema,
         required=True,
         many=True,
-        description="The plugin settings",
+        metadata={
+            "description": "The plugin settings",
+        },
     )
     library_id = fields.Int(
         required=False,
         load_default=0,
-        example=1,
+        metadata={
+            "example": 1,
+        },
     )
 
 
@@ -736,12 +928,16 @@ class RequestPluginsSettingsResetSchema(BaseSchema):
 
     plugin_id = fields.Str(
         required=True,
-        example="encoder_video_hevc_vaapi",
+        metadata={
+            "example": "encoder_video_hevc_vaapi",
+        },
     )
     library_id = fields.Int(
         required=False,
         load_default=0,
-        example=1,
+        metadata={
+            "example": 1,
+        },
     )
 
 
@@ -750,23 +946,31 @@ class PluginsMetadataInstallableResultsSchema(PluginsMetadataResultsSchema):
 
     package_url = fields.Str(
         required=False,
-        description="The plugin package download URL",
-        example="https://raw.githubusercontent.com/Unmanic/unmanic-plugins/repo/plugin_id/plugin_id-1.0.0.zip",
+        metadata={
+            "description": "The plugin package download URL",
+            "example":     "https://raw.githubusercontent.com/Unmanic/unmanic-plugins/repo/plugin_id/plugin_id-1.0.0.zip",
+        },
     )
     changelog_url = fields.Str(
         required=False,
-        description="The plugin package download URL",
-        example="https://raw.githubusercontent.com/Unmanic/unmanic-plugins/repo/plugin_id/changelog.md",
+        metadata={
+            "description": "The plugin package download URL",
+            "example":     "https://raw.githubusercontent.com/Unmanic/unmanic-plugins/repo/plugin_id/changelog.md",
+        },
     )
     repo_name = fields.Str(
         required=False,
-        description="The name of the repository that this plugin is in",
-        example="Official Repo",
+        metadata={
+            "description": "The name of the repository that this plugin is in",
+            "example":     "Official Repo",
+        },
     )
     repo_id = fields.Str(
         required=False,
-        description="The ID of the repository that this plugin is in",
-        example="158899500680826593283708490873332175078",
+        metadata={
+            "description": "The ID of the repository that this plugin is in",
+            "example":     "158899500680826593283708490873332175078",
+        },
     )
 
 
@@ -776,9 +980,11 @@ class PluginsInstallableResultsSchema(BaseSchema):
     plugins = fields.Nested(
         PluginsMetadataInstallableResultsSchema,
         required=True,
-        description="Results",
+        metadata={
+            "description": "Results",
+        },
         many=True,
-        validate=validate.Length(min=0),
+        validate=_MIN_LENGTH_0,
     )
 
 
@@ -788,13 +994,15 @@ class PluginTypesResultsSchema(BaseSchema):
     results = fields.List(
         cls_or_instance=fields.Str,
         required=True,
-        description="List of Plugin Type IDs supported by this installation",
-        example=[
-            "library_management.file_test",
-            "postprocessor.file_move",
-            "postprocessor.task_result",
-            "worker.process_item"
-        ],
+        metadata={
+            "description": "List of Plugin Type IDs supported by this installation",
+            "example":     [
+                "library_management.file_test",
+                "postprocessor.file_move",
+                "postprocessor.task_result",
+                "worker.process_item"
+            ],
+        },
     )
 
 
@@ -803,12 +1011,16 @@ class RequestPluginsFlowByPluginTypeSchema(BaseSchema):
 
     plugin_type = fields.Str(
         required=True,
-        example="library_management.file_test",
+        metadata={
+            "example": "library_management.file_test",
+        },
     )
     library_id = fields.Int(
         required=False,
         load_default=1,
-        example=1,
+        metadata={
+            "example": 1,
+        },
     )
 
 
@@ -817,33 +1029,46 @@ class PluginFlowDataResultsSchema(BaseSchema):
 
     plugin_id = fields.Str(
         required=True,
-        description="The plugin ID",
-        example="encoder_video_h264_nvenc",
+        metadata={
+            "description": "The plugin ID",
+            "example":     "encoder_video_h264_nvenc",
+        },
     )
     name = fields.Str(
         required=True,
-        description="The plugin name",
-        example="Video Encoder H264 - h264_nvenc",
+        metadata={
+            "description": "The plugin name",
+            "example":     "Video Encoder H264 - h264_nvenc",
+        },
     )
     author = fields.Str(
         required=True,
-        description="The plugin author",
-        example="encoder_video_h264_nvenc",
+        metadata={
+            "description": "The plugin author",
+            "example":     "encoder_video_h264_nvenc",
+        },
     )
     description = fields.Str(
         required=True,
-        description="The plugin description",
-        example="Ensure all video streams are encoded with the H264 codec using the h264_nvenc encoder.",
+        metadata={
+            "description": "The plugin description",
+            "example":     "Ensure all video streams are encoded with the H264 codec using the h264_nvenc encoder.",
+        },
     )
     version = fields.Str(
         required=True,
-        description="The plugin version",
-        example="Josh.5",
+        metadata={
+            "description": "The plugin version",
+            "example":     "Josh.5",
+        },
     )
     icon = fields.Str(
         required=True,
-        description="The plugin icon",
-        example="https://raw.githubusercontent.com/Josh5/unmanic-plugins/master/source/encoder_video_h264_nvenc/icon.png",
+        metadata={
+            "description": "The plugin icon",
+            "example":     "https://raw.githubusercontent.com/Josh5/unmanic-plugins/master/source/"
+                           "encoder_video_h264_nvenc/icon.png",
+        },
     )
 
 
@@ -853,9 +1078,11 @@ class PluginFlowResultsSchema(BaseSchema):
     results = fields.Nested(
         PluginFlowDataResultsSchema,
         required=True,
-        description="Results",
+        metadata={
+            "description": "Results",
+        },
         many=True,
-        validate=validate.Length(min=0),
+        validate=_MIN_LENGTH_0,
     )
 
 
@@ -865,14 +1092,18 @@ class RequestSavingPluginsFlowByPluginTypeSchema(RequestPluginsFlowByPluginTypeS
     plugin_flow = fields.Nested(
         PluginFlowDataResultsSchema,
         required=True,
-        description="Saved flow",
+        metadata={
+            "description": "Saved flow",
+        },
         many=True,
-        validate=validate.Length(min=1),
+        validate=_MIN_LENGTH_1,
     )
     library_id = fields.Int(
         required=False,
         load_default=1,
-        example=1,
+        metadata={
+            "example": 1,
+        },
     )
 
 
@@ -881,23 +1112,31 @@ class PluginReposMetadataResultsSchema(BaseSchema):
 
     id = fields.Str(
         required=True,
-        description="The plugin repo ID",
-        example="repository.josh5",
+        metadata={
+            "description": "The plugin repo ID",
+            "example":     "repository.josh5",
+        },
     )
     name = fields.Str(
         required=True,
-        description="The plugin repo name",
-        example="Josh.5 Development Plugins for Unmanic",
+        metadata={
+            "description": "The plugin repo name",
+            "example":     "Josh.5 Development Plugins for Unmanic",
+        },
     )
     icon = fields.Str(
         required=True,
-        description="The plugin repo icon",
-        example="https://raw.githubusercontent.com/Josh5/unmanic-plugins/master/icon.png",
+        metadata={
+            "description": "The plugin repo icon",
+            "example":     "https://raw.githubusercontent.com/Josh5/unmanic-plugins/master/icon.png",
+        },
     )
     path = fields.Str(
         required=True,
-        description="The plugin repo URL path",
-        example="https://raw.githubusercontent.com/Josh5/unmanic-plugins/repo/repo.json",
+        metadata={
+            "description": "The plugin repo URL path",
+            "example":     "https://raw.githubusercontent.com/Josh5/unmanic-plugins/repo/repo.json",
+        },
     )
 
 
@@ -907,11 +1146,13 @@ class RequestUpdatePluginReposListSchema(BaseSchema):
     repos_list = fields.List(
         cls_or_instance=fields.Str,
         required=True,
-        description="A list of repost to save",
-        example=[
-            'https://raw.githubusercontent.com/Josh5/unmanic-plugins/repo/repo.json',
-        ],
-        validate=validate.Length(min=0),
+        metadata={
+            "description": "A list of repost to save",
+            "example":     [
+                'https://raw.githubusercontent.com/Josh5/unmanic-plugins/repo/repo.json',
+            ],
+        },
+        validate=_MIN_LENGTH_0,
     )
 
 
@@ -921,9 +1162,11 @@ class PluginReposListResultsSchema(BaseSchema):
     repos = fields.Nested(
         PluginReposMetadataResultsSchema,
         required=True,
-        description="Results",
+        metadata={
+            "description": "Results",
+        },
         many=True,
-        validate=validate.Length(min=0),
+        validate=_MIN_LENGTH_0,
     )
 
 
@@ -933,9 +1176,11 @@ class PluginsDataPanelTypesDataSchema(BaseSchema):
     results = fields.Nested(
         PluginFlowDataResultsSchema,
         required=True,
-        description="Results",
+        metadata={
+            "description": "Results",
+        },
         many=True,
-        validate=validate.Length(min=0),
+        validate=_MIN_LENGTH_0,
     )
 
 
@@ -947,33 +1192,45 @@ class SessionStateSuccessSchema(BaseSchema):
 
     level = fields.Int(
         required=True,
-        description="User level",
-        example=0,
+        metadata={
+            "description": "User level",
+            "example":     0,
+        },
     )
     picture_uri = fields.Str(
         required=False,
-        description="User picture",
-        example="https://c8.patreon.com/2/200/561356054",
+        metadata={
+            "description": "User picture",
+            "example":     "https://c8.patreon.com/2/200/561356054",
+        },
     )
     name = fields.Str(
         required=False,
-        description="User name",
-        example="ExampleUsername123",
+        metadata={
+            "description": "User name",
+            "example":     "ExampleUsername123",
+        },
     )
     email = fields.Str(
         required=False,
-        description="User email",
-        example="example@gmail.com",
+        metadata={
+            "description": "User email",
+            "example":     "example@gmail.com",
+        },
     )
     created = fields.Number(
         required=False,
-        description="Session time created",
-        example=1627793093.676484,
+        metadata={
+            "description": "Session time created",
+            "example":     1627793093.676484,
+        },
     )
     uuid = fields.Str(
         required=True,
-        description="Installation uuid",
-        example="b429fcc7-9ce1-bcb3-2b8a-b094747f226e",
+        metadata={
+            "description": "Installation uuid",
+            "example":     "b429fcc7-9ce1-bcb3-2b8a-b094747f226e",
+        },
     )
 
 
@@ -985,16 +1242,18 @@ class SettingsReadAndWriteSchema(BaseSchema):
 
     settings = fields.Dict(
         required=True,
-        description="The current settings",
-        example={
-            "ui_port":                    8888,
-            "debugging":                  False,
-            "library_path":               "/library",
-            "enable_library_scanner":     False,
-            "schedule_full_scan_minutes": 1440,
-            "follow_symlinks":            True,
-            "run_full_scan_on_start":     False,
-            "cache_path":                 "/tmp/unmanic"
+        metadata={
+            "description": "The current settings",
+            "example":     {
+                "ui_port":                    8888,
+                "debugging":                  False,
+                "library_path":               "/library",
+                "enable_library_scanner":     False,
+                "schedule_full_scan_minutes": 1440,
+                "follow_symlinks":            True,
+                "run_full_scan_on_start":     False,
+                "cache_path":                 "/tmp/unmanic"
+            },
         },
     )
 
@@ -1004,8 +1263,10 @@ class SettingsSystemConfigSchema(BaseSchema):
 
     configuration = fields.Dict(
         required=True,
-        description="The current system configuration",
-        example={},
+        metadata={
+            "description": "The current system configuration",
+            "example":     {},
+        },
     )
 
 
@@ -1014,23 +1275,31 @@ class WorkerEventScheduleResultsSchema(BaseSchema):
 
     repetition = fields.Str(
         required=True,
-        description="",
-        example="daily",
+        metadata={
+            "description": "",
+            "example":     "daily",
+        },
     )
     schedule_task = fields.Str(
         required=True,
-        description="The type of task. ['count', 'pause', 'resume']",
-        example="count",
+        metadata={
+            "description": "The type of task. ['count', 'pause', 'resume']",
+            "example":     "count",
+        },
     )
     schedule_time = fields.Str(
         required=True,
-        description="",
-        example="The time when the task should be executed on",
+        metadata={
+            "description": "",
+            "example":     "The time when the task should be executed on",
+        },
     )
     schedule_worker_count = fields.Int(
         required=False,
-        description="The worker count to set (only valid if schedule_task is count)",
-        example=4,
+        metadata={
+            "description": "The worker count to set (only valid if schedule_task is count)",
+            "example":     4,
+        },
     )
 
 
@@ -1039,37 +1308,49 @@ class SettingsWorkerGroupConfigSchema(BaseSchema):
 
     id = fields.Int(
         required=True,
-        description="",
-        example=1,
+        metadata={
+            "description": "",
+            "example":     1,
+        },
         allow_none=True,
     )
     locked = fields.Boolean(
         required=True,
-        description="If the worker group is locked and cannot be deleted",
-        example=False,
+        metadata={
+            "description": "If the worker group is locked and cannot be deleted",
+            "example":     False,
+        },
     )
     name = fields.Str(
         required=True,
-        description="The name of the worker group",
-        example="Default Group",
+        metadata={
+            "description": "The name of the worker group",
+            "example":     "Default Group",
+        },
     )
     number_of_workers = fields.Int(
         required=True,
-        description="The number of workers in this group",
-        example=3,
+        metadata={
+            "description": "The number of workers in this group",
+            "example":     3,
+        },
     )
     worker_event_schedules = fields.Nested(
         WorkerEventScheduleResultsSchema,
         required=True,
-        description="Any scheduled evenets for this worker group",
+        metadata={
+            "description": "Any scheduled evenets for this worker group",
+        },
         many=True,
-        validate=validate.Length(min=0),
+        validate=_MIN_LENGTH_0,
     )
     tags = fields.List(
         cls_or_instance=fields.Str,
         required=True,
-        description="A list of tags associated with this worker",
-        example=['GPU', 'priority'],
+        metadata={
+            "description": "A list of tags associated with this worker",
+            "example":     ['GPU', 'priority'],
+        },
     )
 
 
@@ -1079,9 +1360,11 @@ class WorkerGroupsListSchema(BaseSchema):
     worker_groups = fields.Nested(
         SettingsWorkerGroupConfigSchema,
         required=True,
-        description="Results",
+        metadata={
+            "description": "Results",
+        },
         many=True,
-        validate=validate.Length(min=0),
+        validate=_MIN_LENGTH_0,
     )
 
 
@@ -1090,25 +1373,33 @@ class RequestSettingsRemoteInstallationAddressValidationSchema(BaseSchema):
 
     address = fields.Str(
         required=True,
-        description="The address of the remote installation",
-        example="192.168.1.2:8888",
+        metadata={
+            "description": "The address of the remote installation",
+            "example":     "192.168.1.2:8888",
+        },
     )
     auth = fields.Str(
         required=False,
-        description="Authentication type",
-        example="Basic",
+        metadata={
+            "description": "Authentication type",
+            "example":     "Basic",
+        },
         allow_none=True,
     )
     username = fields.Str(
         required=False,
-        description="An optional username",
-        example="foo",
+        metadata={
+            "description": "An optional username",
+            "example":     "foo",
+        },
         allow_none=True,
     )
     password = fields.Str(
         required=False,
-        description="An optional password",
-        example="bar",
+        metadata={
+            "description": "An optional password",
+            "example":     "bar",
+        },
         allow_none=True,
     )
 
@@ -1118,8 +1409,10 @@ class SettingsRemoteInstallationDataSchema(BaseSchema):
 
     installation = fields.Dict(
         required=True,
-        description="The data from the remote installation",
-        example={},
+        metadata={
+            "description": "The data from the remote installation",
+            "example":     {},
+        },
     )
 
 
@@ -1128,8 +1421,10 @@ class RequestRemoteInstallationLinkConfigSchema(BaseSchema):
 
     uuid = fields.Str(
         required=True,
-        description="The uuid of the remote installation",
-        example="7cd35429-76ab-4a29-8649-8c91236b5f8b",
+        metadata={
+            "description": "The uuid of the remote installation",
+            "example":     "7cd35429-76ab-4a29-8649-8c91236b5f8b",
+        },
     )
 
 
@@ -1138,29 +1433,33 @@ class SettingsRemoteInstallationLinkConfigSchema(BaseSchema):
 
     link_config = fields.Dict(
         required=True,
-        description="The configuration for the remote installation link",
-        example={
-            "address":                         "10.0.0.2:8888",
-            "auth":                            "None",
-            "username":                        "",
-            "password":                        "",
-            "available":                       True,
-            "name":                            "API schema generated",
-            "version":                         "0.1.3",
-            "last_updated":                    1636166593.013826,
-            "enable_receiving_tasks":          False,
-            "enable_sending_tasks":            False,
-            "enable_task_preloading":          True,
-            "enable_distributed_worker_count": False,
-            "preloading_count":                2,
-            "enable_checksum_validation":      False,
-            "enable_config_missing_libraries": False,
+        metadata={
+            "description": "The configuration for the remote installation link",
+            "example":     {
+                "address":                         "10.0.0.2:8888",
+                "auth":                            "None",
+                "username":                        "",
+                "password":                        "",
+                "available":                       True,
+                "name":                            "API schema generated",
+                "version":                         "0.1.3",
+                "last_updated":                    1636166593.013826,
+                "enable_receiving_tasks":          False,
+                "enable_sending_tasks":            False,
+                "enable_task_preloading":          True,
+                "enable_distributed_worker_count": False,
+                "preloading_count":                2,
+                "enable_checksum_validation":      False,
+                "enable_config_missing_libraries": False,
+            },
         },
     )
     distributed_worker_count_target = fields.Int(
         required=False,
-        description="The target count of workers to be distributed across any configured linked installations",
-        example=4,
+        metadata={
+            "description": "The target count of workers to be distributed across any configured linked installations",
+            "example":     4,
+        },
     )
 
 
@@ -1169,44 +1468,60 @@ class LibraryResultsSchema(BaseSchema):
 
     id = fields.Int(
         required=True,
-        description="",
-        example=1,
+        metadata={
+            "description": "",
+            "example":     1,
+        },
     )
     name = fields.Str(
         required=True,
-        description="The name of the library",
-        example="Default",
+        metadata={
+            "description": "The name of the library",
+            "example":     "Default",
+        },
     )
     path = fields.Str(
         required=True,
-        description="The library path",
-        example="/library",
+        metadata={
+            "description": "The library path",
+            "example":     "/library",
+        },
     )
     locked = fields.Boolean(
         required=True,
-        description="If the library is locked and cannot be deleted",
-        example=False,
+        metadata={
+            "description": "If the library is locked and cannot be deleted",
+            "example":     False,
+        },
     )
     enable_remote_only = fields.Boolean(
         required=True,
-        description="If the library is configured for remote files only",
-        example=False,
+        metadata={
+            "description": "If the library is configured for remote files only",
+            "example":     False,
+        },
     )
     enable_scanner = fields.Boolean(
         required=True,
-        description="If the library is configured to execute library scans",
-        example=False,
+        metadata={
+            "description": "If the library is configured to execute library scans",
+            "example":     False,
+        },
     )
     enable_inotify = fields.Boolean(
         required=True,
-        description="If the library is configured to monitor for file changes",
-        example=False,
+        metadata={
+            "description": "If the library is configured to monitor for file changes",
+            "example":     False,
+        },
     )
     tags = fields.List(
         cls_or_instance=fields.Str,
         required=True,
-        description="A list of tags associated with this library",
-        example=['GPU', 'priority'],
+        metadata={
+            "description": "A list of tags associated with this library",
+            "example":     ['GPU', 'priority'],
+        },
     )
 
 
@@ -1216,9 +1531,11 @@ class SettingsLibrariesListSchema(BaseSchema):
     libraries = fields.Nested(
         LibraryResultsSchema,
         required=True,
-        description="Results",
+        metadata={
+            "description": "Results",
+        },
         many=True,
-        validate=validate.Length(min=1),
+        validate=_MIN_LENGTH_1,
     )
 
 
@@ -1227,8 +1544,10 @@ class RequestLibraryByIdSchema(BaseSchema):
 
     id = fields.Int(
         required=True,
-        description="The ID of the library",
-        example=1,
+        metadata={
+            "description": "The ID of the library",
+            "example":     1,
+        },
     )
 
 
@@ -1237,31 +1556,35 @@ class SettingsLibraryConfigReadAndWriteSchema(BaseSchema):
 
     library_config = fields.Dict(
         required=True,
-        description="The library configuration",
-        example={
-            "id":             1,
-            "name":           "Default",
-            "path":           "/library",
-            "enable_scanner": False,
-            "enable_inotify": False,
-            "priority_score": 0,
-            "tags":           [],
+        metadata={
+            "description": "The library configuration",
+            "example":     {
+                "id":             1,
+                "name":           "Default",
+                "path":           "/library",
+                "enable_scanner": False,
+                "enable_inotify": False,
+                "priority_score": 0,
+                "tags":           [],
+            },
         },
     )
 
     plugins = fields.Dict(
         required=False,
-        description="The library's enabled plugins",
-        example={
-            "enabled_plugins": [
-                {
-                    "library_id":  1,
-                    "plugin_id":   "notify_plex",
-                    "name":        "Notify Plex",
-                    "description": "Notify Plex on completion of a task.",
-                    "icon":        "https://raw.githubusercontent.com/Josh5/unmanic.plugin.notify_plex/master/icon.png"
-                }
-            ]
+        metadata={
+            "description": "The library's enabled plugins",
+            "example":     {
+                "enabled_plugins": [
+                    {
+                        "library_id":  1,
+                        "plugin_id":   "notify_plex",
+                        "name":        "Notify Plex",
+                        "description": "Notify Plex on completion of a task.",
+                        "icon":        "https://raw.githubusercontent.com/Josh5/unmanic.plugin.notify_plex/master/icon.png"
+                    }
+                ]
+            },
         },
     )
 
@@ -1271,55 +1594,60 @@ class SettingsLibraryPluginConfigExportSchema(BaseSchema):
 
     plugins = fields.Dict(
         required=True,
-        description="The library's enabled plugins",
-        example={
-            "enabled_plugins": [
-                {
-                    "library_id":  1,
-                    "plugin_id":   "encoder_audio_ac3",
-                    "name":        "Audio Encoder AC3",
-                    "description": "Ensure all audio streams are encoded with the AC3 codec using the native FFmpeg ac3 encoder.",
-                    "icon":        "https://raw.githubusercontent.com/Josh5/unmanic.plugin.encoder_audio_ac3/master/icon.png"
-                }
-            ],
-            "plugin_flow":     {
-                "library_management.file_test": [
+        metadata={
+            "description": "The library's enabled plugins",
+            "example":     {
+                "enabled_plugins": [
                     {
+                        "library_id":  1,
                         "plugin_id":   "encoder_audio_ac3",
                         "name":        "Audio Encoder AC3",
-                        "author":      "Josh.5",
                         "description": "Ensure all audio streams are encoded with the AC3 codec using the native FFmpeg ac3 encoder.",
-                        "version":     "0.0.2",
-                        "icon":        "https://raw.githubusercontent.com/Josh5/unmanic.plugin.encoder_audio_ac3/master/icon.png"
+                        "icon":        "https://raw.githubusercontent.com/Josh5/unmanic.plugin.encoder_audio_ac3/"
+                                       "master/icon.png"
                     }
                 ],
-                "worker.process_item":          [
-                    {
-                        "plugin_id":   "encoder_audio_ac3",
-                        "name":        "Audio Encoder AC3",
-                        "author":      "Josh.5",
-                        "description": "Ensure all audio streams are encoded with the AC3 codec using the native FFmpeg ac3 encoder.",
-                        "version":     "0.0.2",
-                        "icon":        "https://raw.githubusercontent.com/Josh5/unmanic.plugin.encoder_audio_ac3/master/icon.png"
-                    }
-                ],
-                "postprocessor.file_move":      [],
-                "postprocessor.task_result":    []
-            }
+                "plugin_flow":     {
+                    "library_management.file_test": [
+                        {
+                            "plugin_id":   "encoder_audio_ac3",
+                            "name":        "Audio Encoder AC3",
+                            "author":      "Josh.5",
+                            "description": "Ensure all audio streams are encoded with the AC3 codec using the native FFmpeg ac3 encoder.",
+                            "version":     "0.0.2",
+                            "icon":        "https://raw.githubusercontent.com/Josh5/unmanic.plugin.encoder_audio_ac3/master/icon.png"
+                        }
+                    ],
+                    "worker.process_item":          [
+                        {
+                            "plugin_id":   "encoder_audio_ac3",
+                            "name":        "Audio Encoder AC3",
+                            "author":      "Josh.5",
+                            "description": "Ensure all audio streams are encoded with the AC3 codec using the native FFmpeg ac3 encoder.",
+                            "version":     "0.0.2",
+                            "icon":        "https://raw.githubusercontent.com/Josh5/unmanic.plugin.encoder_audio_ac3/master/icon.png"
+                        }
+                    ],
+                    "postprocessor.file_move":      [],
+                    "postprocessor.task_result":    []
+                }
+            },
         },
     )
 
     library_config = fields.Dict(
         required=False,
-        description="The library configuration",
-        example={
-            "id":             1,
-            "name":           "Default",
-            "path":           "/library",
-            "enable_scanner": False,
-            "enable_inotify": False,
-            "priority_score": 0,
-            "tags":           [],
+        metadata={
+            "description": "The library configuration",
+            "example":     {
+                "id":             1,
+                "name":           "Default",
+                "path":           "/library",
+                "enable_scanner": False,
+                "enable_inotify": False,
+                "priority_score": 0,
+                "tags":           [],
+            },
         },
     )
 
@@ -1329,7 +1657,9 @@ class SettingsLibraryPluginConfigImportSchema(SettingsLibraryPluginConfigExportS
 
     library_id = fields.Int(
         required=True,
-        example=1,
+        metadata={
+            "example": 1,
+        },
     )
 
 
@@ -1341,8 +1671,10 @@ class VersionReadSuccessSchema(BaseSchema):
 
     version = fields.Str(
         required=True,
-        description="Application version",
-        example="1.0.0",
+        metadata={
+            "description": "Application version",
+            "example":     "1.0.0",
+        },
     )
 
 
@@ -1354,7 +1686,9 @@ class RequestWorkerByIdSchema(BaseSchema):
 
     worker_id = fields.Str(
         required=True,
-        example="1",
+        metadata={
+            "example": "1",
+        },
     )
 
 
@@ -1363,76 +1697,96 @@ class WorkerStatusResultsSchema(BaseSchema):
 
     id = fields.Str(
         required=True,
-        description="",
-        example="W0",
+        metadata={
+            "description": "",
+            "example":     "W0",
+        },
     )
     name = fields.Str(
         required=True,
-        description="",
-        example="Worker-W0",
+        metadata={
+            "description": "",
+            "example":     "Worker-W0",
+        },
     )
     idle = fields.Boolean(
         required=True,
-        description="Flag - is worker idle",
-        example=True,
+        metadata={
+            "description": "Flag - is worker idle",
+            "example":     True,
+        },
     )
     paused = fields.Boolean(
         required=True,
-        description="Flag - is worker paused",
-        example=False,
+        metadata={
+            "description": "Flag - is worker paused",
+            "example":     False,
+        },
     )
     start_time = fields.Str(
         required=True,
-        description="The time when this worker started processing a task",
-        example="1635746377.0021548",
+        metadata={
+            "description": "The time when this worker started processing a task",
+            "example":     "1635746377.0021548",
+        },
         allow_none=True,
     )
     current_file = fields.Str(
         required=True,
-        description="The basename of the file currently being processed",
-        example="file.mp4",
+        metadata={
+            "description": "The basename of the file currently being processed",
+            "example":     "file.mp4",
+        },
     )
     current_task = fields.Int(
         required=True,
-        description="The Task ID",
-        example=1,
+        metadata={
+            "description": "The Task ID",
+            "example":     1,
+        },
         allow_none=True,
     )
     worker_log_tail = fields.List(
         cls_or_instance=fields.Str,
         required=True,
-        description="The log lines produced by the worker",
-        example=[
-            "\n\nRUNNER: \nRemux Video Files [Pass #1]\n\n",
-            "\nExecuting plugin runner... Please wait",
-            "\nRunner did not request to execute a command",
-            "\n\nNo Plugin requested to run commands for this file '/tmp/unmanic/unmanic_remote_pending_library-1635746225.3336523/file.mp4'"
-        ],
-        validate=validate.Length(min=0),
+        metadata={
+            "description": "The log lines produced by the worker",
+            "example":     [
+                "\n\nRUNNER: \nRemux Video Files [Pass #1]\n\n",
+                "\nExecuting plugin runner... Please wait",
+                "\nRunner did not request to execute a command",
+                "\n\nNo Plugin requested to run commands for this file '/tmp/unmanic/unmanic_remote_pending_library-1635746225.3336523/file.mp4'"
+            ],
+        },
+        validate=_MIN_LENGTH_0,
     )
     runners_info = fields.Dict(
         required=True,
-        description="The status of the plugin runner currently processing the file",
-        example={
-            "video_remuxer": {
-                "plugin_id":   "video_remuxer",
-                "status":      "complete",
-                "name":        "Remux Video Files",
-                "author":      "Josh.5",
-                "version":     "0.0.5",
-                "icon":        "https://raw.githubusercontent.com/Josh5/unmanic.plugin.video_remuxer/master/icon.png",
-                "description": "Remux a video file to the configured container",
-                "success":     True
-            }
+        metadata={
+            "description": "The status of the plugin runner currently processing the file",
+            "example":     {
+                "video_remuxer": {
+                    "plugin_id":   "video_remuxer",
+                    "status":      "complete",
+                    "name":        "Remux Video Files",
+                    "author":      "Josh.5",
+                    "version":     "0.0.5",
+                    "icon":        "https://raw.githubusercontent.com/Josh5/unmanic.plugin.video_remuxer/master/icon.png",
+                    "description": "Remux a video file to the configured container",
+                    "success":     True
+                }
+            },
         },
     )
     subprocess = fields.Dict(
         required=True,
-        description="The status of the process currently being executed",
-        example={
-            "pid":     140408939493120,
-            "percent": "None",
-            "elapsed": "None"
+        metadata={
+            "description": "The status of the process currently being executed",
+            "example":     {
+                "pid":     140408939493120,
+                "percent": "None",
+                "elapsed": "None"
+            },
         },
     )
 
@@ -1443,7 +1797,51 @@ class WorkerStatusSuccessSchema(BaseSchema):
     workers_status = fields.Nested(
         WorkerStatusResultsSchema,
         required=True,
-        description="Results",
+        metadata={
+            "description": "Results",
+        },
         many=True,
-        validate=validate.Length(min=0),
-    )
+        validate=_MIN_LENGTH_0,
+    )
+
+
+# SCHEMA INSTANCES
+# ================
+
+_INSTANCES = {}
+
+
+def _build_nested_schemas(schema):
+    """
+    Build the schemas of any Nested fields in the given schema.
+    marshmallow otherwise builds these on first use, which would mean handler threads are
+    still modifying a shared schema instance while it is being used.
+
+    :param schema:
+    :return:
+    """
+    pending_fields = list(schema.fields.values())
+    while pending_fields:
+        field = pending_fields.pop()
+        if isinstance(field, fields.Nested):
+            pending_fields.extend(field.schema.fields.values())
+        elif isinstance(field, fields.List):
+            pending_fields.append(field.inner)
+
+
+def get_schema(schema_class, many=False):
+    """
+    Return a shared instance of the given schema class.
+    Schemas are stateless once constructed, so each one is built once and reused across requests.
+
+    :param schema_class:
+    :param many:
+    :return:
+    """
+    key = (schema_class, many)
+    schema = _INSTANCES.get(key)
+    if schema is None:
+        schema = schema_class(many=many)
+        _build_nested_schemas(schema)
+        schema = _INSTANCES.setdefault(key, schema)
+    return schema
@@ -34,7 +34,7 @@ import tornado.log
 from unmanic.libs import session
 from unmanic.libs.uiserver import UnmanicDataQueues
 from unmanic.webserver.api_v2.base_api_handler import BaseApiHandler, BaseApiError
-from unmanic.webserver.api_v2.schema.schemas import SessionStateSuccessSchema
+from unmanic.webserver.api_v2.schema.schemas import SessionStateSuccessSchema, get_schema
 
 
 class ApiSessionHandler(BaseApiHandler):
@@ -43,6 +43,9 @@ class ApiSessionHandler(BaseApiHandler):
     params = None
     unmanic_data_queues = None
 
+    # The serialized session state response and its ETag, along with the session state it was built from
+    _state_response_cache = (None, None, None)
+
     routes = [
         {
             "path_pattern":      r"/session/state",
@@ -105,18 +108,22 @@ class ApiSessionHandler(BaseApiHandler):
                 self.write_error()
                 return
             else:
-                response = self.build_response(
-                    SessionStateSuccessSchema(),
-                    {
-                        "level":       self.session.level,
-                        "picture_uri": self.session.picture_uri,
-                        "name":        self.session.name,
-                        "email":       self.session.email,
-                        "created":     self.session.created,
-                        "uuid":        self.session.uuid,
-                    }
-                )
-                self.write_success(response)
+                session_state = {
+                    "level":       self.session.level,
+                    "picture_uri": self.session.picture_uri,
+                    "name":        self.session.name,
+                    "email":       self.session.email,
+                    "created":     self.session.created,
+                    "uuid":        self.session.uuid,
+                }
+                # The UI polls this endpoint. Only rebuild the response when the session state has changed
+                cached_state, body, etag = self._state_response_cache
+                if cached_state != session_state:
+                    response = self.build_response(get_schema(SessionStateSuccessSchema), session_state)
+                    body = self.encode_json(response)
+                    etag = self.compute_body_etag(body)
+                    ApiSessionHandler._state_response_cache = (session_state, body, etag)
+                self.write_success_body(body, etag)
                 return
         except BaseApiError as bae:
             tornado.log.app_log.error("BaseApiError.{}: {}".format(self.route.get('call_method'), str(bae)))
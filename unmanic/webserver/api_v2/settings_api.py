@@ -40,11 +40,10 @@ from unmanic.libs.worker_group import WorkerGroup
 from unmanic.webserver.api_v2.base_api_handler import BaseApiError, BaseApiHandler
 from unmanic.webserver.api_v2.schema.schemas import RequestDatabaseItemByIdSchema, RequestLibraryByIdSchema, \
     RequestRemoteInstallationLinkConfigSchema, SettingsLibrariesListSchema, SettingsLibraryConfigReadAndWriteSchema, \
-    SettingsLibraryPluginConfigExportSchema, \
-    SettingsLibraryPluginConfigImportSchema, SettingsReadAndWriteSchema, \
-    SettingsRemoteInstallationDataSchema, \
-    SettingsRemoteInstallationLinkConfigSchema, SettingsSystemConfigSchema, \
-    RequestSettingsRemoteInstallationAddressValidationSchema, SettingsWorkerGroupConfigSchema, WorkerGroupsListSchema
+    SettingsLibraryPluginConfigExportSchema, SettingsLibraryPluginConfigImportSchema, SettingsReadAndWriteSchema, \
+    SettingsRemoteInstallationDataSchema, SettingsRemoteInstallationLinkConfigSchema, SettingsSystemConfigSchema, \
+    RequestSettingsRemoteInstallationAddressValidationSchema, SettingsWorkerGroupConfigSchema, WorkerGroupsListSchema, \
+    get_schema
 from unmanic.webserver.helpers import plugins
 
 
@@ -187,7 +186,7 @@ class ApiSettingsHandler(BaseApiHandler):
         try:
             settings = self.config.get_config_as_dict()
             response = self.build_response(
-                SettingsReadAndWriteSchema(),
+                get_schema(SettingsReadAndWriteSchema),
                 {
                     "settings": settings,
                 }
@@ -246,7 +245,7 @@ class ApiSettingsHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(SettingsReadAndWriteSchema())
+            json_request = self.read_json_request(get_schema(SettingsReadAndWriteSchema))
 
             # Get settings dict from request
             settings_dict = json_request.get('settings', {})
@@ -314,7 +313,7 @@ class ApiSettingsHandler(BaseApiHandler):
             system = System()
             system_info = system.info()
             response = self.build_response(
-                SettingsSystemConfigSchema(),
+                get_schema(SettingsSystemConfigSchema),
                 {
                     "configuration": system_info,
                 }
@@ -373,7 +372,7 @@ class ApiSettingsHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestSettingsRemoteInstallationAddressValidationSchema())
+            json_request = self.read_json_request(get_schema(RequestSettingsRemoteInstallationAddressValidationSchema))
 
             # Fetch all data from the remote installation
             # Throws exception if the provided address is invalid
@@ -384,7 +383,7 @@ class ApiSettingsHandler(BaseApiHandler):
                                                       password=json_request.get('password'))
 
             response = self.build_response(
-                SettingsRemoteInstallationDataSchema(),
+                get_schema(SettingsRemoteInstallationDataSchema),
                 {
                     "installation": data,
                 }
@@ -438,7 +437,7 @@ class ApiSettingsHandler(BaseApiHandler):
         try:
             worker_groups = WorkerGroup.get_all_worker_groups()
             response = self.build_response(
-                WorkerGroupsListSchema(),
+                get_schema(WorkerGroupsListSchema),
                 {
                     "worker_groups": worker_groups,
                 }
@@ -497,7 +496,7 @@ class ApiSettingsHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestDatabaseItemByIdSchema())
+            json_request = self.read_json_request(get_schema(RequestDatabaseItemByIdSchema))
 
             # Fetch all data for this worker group
             worker_group = WorkerGroup(json_request.get('id'))
@@ -507,7 +506,7 @@ class ApiSettingsHandler(BaseApiHandler):
                 return
 
             response = self.build_response(
-                SettingsWorkerGroupConfigSchema(),
+                get_schema(SettingsWorkerGroupConfigSchema),
                 {
                     "id":                     worker_group.get_id(),
                     "locked":                 worker_group.get_locked(),
@@ -571,7 +570,7 @@ class ApiSettingsHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(SettingsWorkerGroupConfigSchema())
+            json_request = self.read_json_request(get_schema(SettingsWorkerGroupConfigSchema))
 
             # Write config for this worker group
             from unmanic.webserver.helpers import settings
@@ -631,7 +630,7 @@ class ApiSettingsHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestDatabaseItemByIdSchema())
+            json_request = self.read_json_request(get_schema(RequestDatabaseItemByIdSchema))
 
             # Fetch existing worker group by ID
             worker_group = WorkerGroup(json_request.get('id'))
@@ -696,7 +695,7 @@ class ApiSettingsHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestRemoteInstallationLinkConfigSchema())
+            json_request = self.read_json_request(get_schema(RequestRemoteInstallationLinkConfigSchema))
 
             # Fetch all data from the remote installation
             # Throws exception if the provided address is invalid
@@ -704,7 +703,7 @@ class ApiSettingsHandler(BaseApiHandler):
             data = links.read_remote_installation_link_config(json_request.get('uuid'))
 
             response = self.build_response(
-                SettingsRemoteInstallationLinkConfigSchema(),
+                get_schema(SettingsRemoteInstallationLinkConfigSchema),
                 {
                     "link_config":                     {
                         "address":                         data.get('address'),
@@ -780,7 +779,7 @@ class ApiSettingsHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(SettingsRemoteInstallationLinkConfigSchema())
+            json_request = self.read_json_request(get_schema(SettingsRemoteInstallationLinkConfigSchema))
 
             # Update a single remote installation config by matching the UUID
             links = Links()
@@ -841,7 +840,7 @@ class ApiSettingsHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestRemoteInstallationLinkConfigSchema())
+            json_request = self.read_json_request(get_schema(RequestRemoteInstallationLinkConfigSchema))
 
             # Delete the remote installation using the given uuid
             links = Links()
@@ -899,7 +898,7 @@ class ApiSettingsHandler(BaseApiHandler):
         try:
             libraries = Library.get_all_libraries()
             response = self.build_response(
-                SettingsLibrariesListSchema(),
+                get_schema(SettingsLibrariesListSchema),
                 {
                     "libraries": libraries,
                 }
@@ -958,7 +957,7 @@ class ApiSettingsHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestLibraryByIdSchema())
+            json_request = self.read_json_request(get_schema(RequestLibraryByIdSchema))
 
             library_settings = {
                 "library_config": {
@@ -995,7 +994,7 @@ class ApiSettingsHandler(BaseApiHandler):
                 }
 
             response = self.build_response(
-                SettingsLibraryConfigReadAndWriteSchema(),
+                get_schema(SettingsLibraryConfigReadAndWriteSchema),
                 library_settings
             )
 
@@ -1053,7 +1052,7 @@ class ApiSettingsHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(SettingsLibraryConfigReadAndWriteSchema())
+            json_request = self.read_json_request(get_schema(SettingsLibraryConfigReadAndWriteSchema))
 
             # Save settings
             from unmanic.webserver.helpers import settings
@@ -1119,7 +1118,7 @@ class ApiSettingsHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestLibraryByIdSchema())
+            json_request = self.read_json_request(get_schema(RequestLibraryByIdSchema))
 
             # Fetch existing library by ID
             library = Library(json_request.get('id'))
@@ -1184,13 +1183,13 @@ class ApiSettingsHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestLibraryByIdSchema())
+            json_request = self.read_json_request(get_schema(RequestLibraryByIdSchema))
 
             # Fetch library config
             library_config = Library.export(json_request.get('id'))
 
             response = self.build_response(
-                SettingsLibraryPluginConfigExportSchema(),
+                get_schema(SettingsLibraryPluginConfigExportSchema),
                 library_config
             )
 
@@ -1248,7 +1247,7 @@ class ApiSettingsHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(SettingsLibraryPluginConfigImportSchema())
+            json_request = self.read_json_request(get_schema(SettingsLibraryPluginConfigImportSchema))
 
             # Save settings
             from unmanic.webserver.helpers import settings
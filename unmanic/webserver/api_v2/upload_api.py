@@ -39,7 +39,7 @@ from unmanic import config
 from unmanic.libs import common, session
 from unmanic.libs.uiserver import FrontendPushMessages
 from unmanic.webserver.api_v2.base_api_handler import BaseApiHandler, BaseApiError
-from unmanic.webserver.api_v2.schema.schemas import PendingTasksTableResultsSchema
+from unmanic.webserver.api_v2.schema.schemas import PendingTasksTableResultsSchema, get_schema
 from unmanic.webserver.helpers import pending_tasks
 
 # CONST
@@ -214,7 +214,7 @@ class ApiUploadHandler(BaseApiHandler):
 
             # Return the details of the generated task
             response = self.build_response(
-                PendingTasksTableResultsSchema(),
+                get_schema(PendingTasksTableResultsSchema),
                 {
                     "id":       task_info.get('id'),
                     "abspath":  task_info.get('abspath'),
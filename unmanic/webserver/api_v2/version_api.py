@@ -35,7 +35,7 @@ from unmanic import config
 from unmanic.libs import session
 from unmanic.libs.uiserver import UnmanicDataQueues
 from unmanic.webserver.api_v2.base_api_handler import BaseApiError, BaseApiHandler
-from unmanic.webserver.api_v2.schema.schemas import VersionReadSuccessSchema
+from unmanic.webserver.api_v2.schema.schemas import VersionReadSuccessSchema, get_schema
 
 
 class ApiVersionHandler(BaseApiHandler):
@@ -44,6 +44,9 @@ class ApiVersionHandler(BaseApiHandler):
     params = None
     unmanic_data_queues = None
 
+    # The serialized version response and its ETag, along with the version it was built from
+    _version_response_cache = (None, None, None)
+
     routes = [
         {
             "path_pattern":      r"/version/read",
@@ -98,13 +101,18 @@ class ApiVersionHandler(BaseApiHandler):
         """
         try:
             version = self.config.read_version()
-            response = self.build_response(
-                VersionReadSuccessSchema(),
-                {
-                    "version": version,
-                }
-            )
-            self.write_success(response)
+            cached_version, body, etag = self._version_response_cache
+            if cached_version != version:
+                response = self.build_response(
+                    get_schema(VersionReadSuccessSchema),
+                    {
+                        "version": version,
+                    }
+                )
+                body = self.encode_json(response)
+                etag = self.compute_body_etag(body)
+                ApiVersionHandler._version_response_cache = (version, body, etag)
+            self.write_success_body(body, etag)
             return
         except BaseApiError as bae:
             tornado.log.app_log.error("BaseApiError.{}: {}".format(self.route.get('call_method'), str(bae)))
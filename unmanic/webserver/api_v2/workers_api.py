@@ -33,7 +33,7 @@
 import tornado.log
 from unmanic.libs.uiserver import UnmanicDataQueues, UnmanicRunningTreads
 from unmanic.webserver.api_v2.base_api_handler import BaseApiHandler, BaseApiError
-from unmanic.webserver.api_v2.schema.schemas import RequestWorkerByIdSchema, WorkerStatusSuccessSchema
+from unmanic.webserver.api_v2.schema.schemas import RequestWorkerByIdSchema, WorkerStatusSuccessSchema, get_schema
 from unmanic.webserver.helpers import workers
 
 
@@ -132,7 +132,7 @@ class ApiWorkersHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestWorkerByIdSchema())
+            json_request = self.read_json_request(get_schema(RequestWorkerByIdSchema))
 
             if not workers.pause_worker_by_id(json_request.get('worker_id')):
                 self.set_status(self.STATUS_ERROR_INTERNAL, reason="Failed to pause worker")
@@ -245,7 +245,7 @@ class ApiWorkersHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestWorkerByIdSchema())
+            json_request = self.read_json_request(get_schema(RequestWorkerByIdSchema))
 
             if not workers.resume_worker_by_id(json_request.get('worker_id')):
                 self.set_status(self.STATUS_ERROR_INTERNAL, reason="Failed to resume worker")
@@ -358,7 +358,7 @@ class ApiWorkersHandler(BaseApiHandler):
                             InternalErrorSchema
         """
         try:
-            json_request = self.read_json_request(RequestWorkerByIdSchema())
+            json_request = self.read_json_request(get_schema(RequestWorkerByIdSchema))
 
             if not workers.terminate_worker_by_id(json_request.get('worker_id')):
                 self.set_status(self.STATUS_ERROR_INTERNAL, reason="Failed to resume worker")
@@ -467,7 +467,7 @@ class ApiWorkersHandler(BaseApiHandler):
             workers_status = self.foreman.get_all_worker_status()
 
             response = self.build_response(
-                WorkerStatusSuccessSchema(),
+                get_schema(WorkerStatusSuccessSchema),
                 {
                     'workers_status': workers_status,
                 }
@@ -72,18 +72,9 @@ def prepare_filtered_completed_tasks(params):
 
     # Fetch historical tasks
     history_logging = history.History()
-    # Get total count
-    records_total_count = history_logging.get_total_historic_task_list_count()
-    # Get total success count
-    records_total_success_count = history_logging.get_historic_task_list_filtered_and_sorted(task_success=True).count()
-    # Get total failed count
-    records_total_failed_count = history_logging.get_historic_task_list_filtered_and_sorted(task_success=False).count()
-    # Get quantity after filters (without pagination)
-    records_filtered_count = history_logging.get_historic_task_list_filtered_and_sorted(order=order, start=0, length=0,
-                                                                                        search_value=search_value,
-                                                                                        task_success=task_success,
-                                                                                        after_time=after_time,
-                                                                                        before_time=before_time).count()
+    # Get total, filtered, success and failed counts
+    counts = history_logging.get_historic_task_status_counts(search_value=search_value, task_success=task_success,
+                                                             after_time=after_time, before_time=before_time)
     # Get filtered/sorted results
     task_results = history_logging.get_historic_task_list_filtered_and_sorted(order=order, start=start, length=length,
                                                                               search_value=search_value,
@@ -92,15 +83,16 @@ def prepare_filtered_completed_tasks(params):
 
     # Build return data
     return_data = {
-        "recordsTotal":    records_total_count,
-        "recordsFiltered": records_filtered_count,
-        "successCount":    records_total_success_count,
-        "failedCount":     records_total_failed_count,
+        "recordsTotal":    counts['total_count'],
+        "recordsFiltered": counts['filtered_count'],
+        "successCount":    counts['success_count'],
+        "failedCount":     counts['failed_count'],
         "results":         []
     }
 
     # Iterate over tasks and append them to the task data
-    for task in task_results:
+    # Use iterator() so the query does not also keep its own cached copy of every row
+    for task in task_results.iterator():
         # Set params as required in template
         item = {
             'id':           task['id'],
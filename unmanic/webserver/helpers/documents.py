@@ -29,12 +29,28 @@
            OR OTHER DEALINGS IN THE SOFTWARE.
 
 """
+import functools
 import os
 import zipfile
 
 from unmanic import config
 
 
+@functools.lru_cache(maxsize=1)
+def read_privacy_policy():
+    """
+    Returns the lines of the privacy policy document.
+    This document is shipped with Unmanic and does not change while it is running, so it is only read once.
+
+    :return:
+    """
+    privacy_policy_file = os.path.join(os.path.dirname(__file__), '..', 'docs', 'privacy_policy.md')
+    if not os.path.exists(privacy_policy_file):
+        return ()
+    with open(privacy_policy_file, 'r') as f:
+        return tuple(f.readlines())
+
+
 def generate_log_files_zip():
     settings = config.Config()
 
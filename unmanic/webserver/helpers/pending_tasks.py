@@ -60,12 +60,8 @@ def prepare_filtered_pending_tasks_for_table(request_dict):
 
     # Fetch tasks
     task_handler = task.Task()
-    # Get total count
-    records_total_count = task_handler.get_total_task_list_count()
-    # Get quantity after filters (without pagination)
-    records_filtered_count = task_handler.get_task_list_filtered_and_sorted(order=order, start=0, length=0,
-                                                                            search_value=search_value,
-                                                                            status='pending').count()
+    # Get total count and quantity after filters (without pagination)
+    counts = task_handler.get_task_list_counts(search_value=search_value, status='pending')
     # Get filtered/sorted results
     pending_task_results = task_handler.get_task_list_filtered_and_sorted(order=order, start=start, length=length,
                                                                           search_value=search_value, status='pending')
@@ -73,15 +69,16 @@ def prepare_filtered_pending_tasks_for_table(request_dict):
     # Build return data
     return_data = {
         "draw":            draw,
-        "recordsTotal":    records_total_count,
-        "recordsFiltered": records_filtered_count,
+        "recordsTotal":    counts['total_count'],
+        "recordsFiltered": counts['filtered_count'],
         "successCount":    0,
         "failedCount":     0,
         "data":            []
     }
 
     # Iterate over tasks and append them to the task data
-    for pending_task in pending_task_results:
+    # Use iterator() so the query does not also keep its own cached copy of every row
+    for pending_task in pending_task_results.iterator():
         # Set params as required in template
         item = {
             'id':       pending_task['id'],
@@ -116,25 +113,22 @@ def prepare_filtered_pending_tasks(params, include_library=False):
 
     # Fetch tasks
     task_handler = task.Task()
-    # Get total count
-    records_total_count = task_handler.get_total_task_list_count()
-    # Get quantity after filters (without pagination)
-    records_filtered_count = task_handler.get_task_list_filtered_and_sorted(order=order, start=0, length=0,
-                                                                            search_value=search_value,
-                                                                            status='pending').count()
+    # Get total count and quantity after filters (without pagination)
+    counts = task_handler.get_task_list_counts(search_value=search_value, status='pending')
     # Get filtered/sorted results
     pending_task_results = task_handler.get_task_list_filtered_and_sorted(order=order, start=start, length=length,
                                                                           search_value=search_value, status='pending')
 
     # Build return data
     return_data = {
-        "recordsTotal":    records_total_count,
-        "recordsFiltered": records_filtered_count,
+        "recordsTotal":    counts['total_count'],
+        "recordsFiltered": counts['filtered_count'],
         "results":         []
     }
 
     # Iterate over tasks and append them to the task data
-    for pending_task in pending_task_results:
+    # Use iterator() so the query does not also keep its own cached copy of every row
+    for pending_task in pending_task_results.iterator():
         # Set params as required in template
         item = {
             'id':       pending_task['id'],
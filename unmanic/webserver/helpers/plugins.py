@@ -35,25 +35,24 @@ from unmanic.libs.plugins import PluginsHandler
 from unmanic.libs.unplugins import PluginExecutor
 
 
-def prepare_filtered_plugins(params):
+def prepare_filtered_plugins(start=0, length=0, search_value='', order_by='name', order_direction='desc'):
     """
     Returns a object of records filtered and sorted
     according to the provided request.
 
-    :param params:
+    :param start:
+    :param length:
+    :param search_value:
+    :param order_by:
+    :param order_direction:
     :return:
     """
-    start = params.get('start', 0)
-    length = params.get('length', 0)
-
-    search_value = params.get('search_value', '')
-
     # Note that plugins can be ordered in multiple ways. So this must be a list
     order = [
-        params.get('order', {
-            "column": 'name',
-            "dir":    'desc',
-        })
+        {
+            "column": order_by,
+            "dir":    order_direction,
+        }
     ]
 
     # Fetch Plugins